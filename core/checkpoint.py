@@ -6,6 +6,7 @@ Saves processing state after each page, allowing recovery if interrupted.
 import json
 import logging
 import os
+import threading
 import time as _time
 from dataclasses import dataclass, asdict
 from datetime import datetime
@@ -93,6 +94,11 @@ class CheckpointManager:
         else:
             self.checkpoint_dir = Path.home() / ".ocr_tool" / "checkpoints"
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        # Files finished by earlier batches, keyed by input path; read lazily
+        self._batch_state_path = self.checkpoint_dir / "batch_state.json"
+        self._batch_state: Optional[dict] = None
+        # Written from the worker and export threads and read from the GUI
+        self._batch_lock = threading.Lock()
 
     def _get_checkpoint_path(self, input_path: str) -> Path:
         """Get checkpoint file path for an input file"""
@@ -170,19 +176,20 @@ class CheckpointManager:
     def save_checkpoint(self, checkpoint: Checkpoint):
         """Save checkpoint to file with retry for Windows antivirus file locks."""
         checkpoint.updated_at = datetime.now().isoformat()
-        checkpoint_path = self._get_checkpoint_path(checkpoint.input_path)
+        self._write_json(self._get_checkpoint_path(checkpoint.input_path), checkpoint.to_dict())
 
-        # Write atomically (write to temp, then rename)
-        temp_path = checkpoint_path.with_suffix('.tmp')
+    def _write_json(self, path: Path, data: dict):
+        """Write JSON atomically (write to temp, then rename)."""
+        temp_path = path.with_suffix('.tmp')
         with open(temp_path, 'w', encoding='utf-8') as f:
-            json.dump(checkpoint.to_dict(), f, ensure_ascii=False, indent=2)
+            json.dump(data, f, ensure_ascii=False, indent=2)
 
         # Retry os.replace() up to 4 times with exponential backoff.
         # Windows antivirus may briefly lock the target file after a write.
         last_err: OSError | None = None
         for attempt in range(4):
             try:
-                os.replace(temp_path, checkpoint_path)
+                os.replace(temp_path, path)
                 return
             except OSError as e:
                 last_err = e
@@ -192,7 +199,7 @@ class CheckpointManager:
         # All retries exhausted
         temp_path.unlink(missing_ok=True)
         logging.getLogger(__name__).warning(
-            "save_checkpoint failed after 4 attempts: %s", last_err
+            "writing %s failed after 4 attempts: %s", path.name, last_err
         )
         raise last_err  # type: ignore[misc]
 
@@ -260,6 +267,87 @@ class CheckpointManager:
         checkpoint.failed_pages.add(page_num)  # O(1) add, set handles duplicates
         self.save_checkpoint(checkpoint)
 
+    def _load_batch_state(self) -> dict:
+        """Load finished-file records, dropping ones older than 24 hours.
+
+        Callers must hold _batch_lock.
+        """
+        if self._batch_state is None:
+            try:
+                with open(self._batch_state_path, 'r', encoding='utf-8') as f:
+                    tasks = json.load(f).get('tasks', {})
+            except Exception:
+                tasks = {}
+            if not isinstance(tasks, dict):
+                tasks = {}
+            cutoff = _time.time() - 24 * 3600
+            self._batch_state = {
+                path: entry for path, entry in tasks.items()
+                if isinstance(entry, dict) and entry.get('completed_at', 0) > cutoff
+            }
+        return self._batch_state
+
+    def mark_task_completed(self, input_path: str, output_path: str, settings_key: str = ""):
+        """
+        Record that a whole file finished, so a restarted batch can skip it.
+
+        Args:
+            input_path: Path to input PDF
+            output_path: Path of the finished output PDF
+            settings_key: Processing settings the output was made with
+        """
+        try:
+            entry = {
+                'output_path': output_path,
+                'input_mtime': os.path.getmtime(input_path),
+                'output_mtime': os.path.getmtime(output_path),
+                'settings': settings_key,
+                'completed_at': _time.time(),
+            }
+        except OSError:
+            return
+        with self._batch_lock:
+            state = self._load_batch_state()
+            state[input_path] = entry
+            try:
+                self._write_json(self._batch_state_path, {'schema': 1, 'tasks': dict(state)})
+            except OSError:
+                pass  # Losing the record only means the file is processed again
+
+    def is_task_completed(self, input_path: str, output_path: str, settings_key: str = "") -> bool:
+        """
+        Check whether a file was already finished with the same settings.
+
+        True only if neither the input nor the recorded output changed since.
+        """
+        with self._batch_lock:
+            entry = self._load_batch_state().get(input_path)
+        if (
+            not isinstance(entry, dict)
+            or entry.get('output_path') != output_path
+            or entry.get('settings') != settings_key
+            or not os.path.exists(output_path)
+        ):
+            return False
+        try:
+            return (
+                os.path.getmtime(input_path) == entry.get('input_mtime')
+                and os.path.getmtime(output_path) == entry.get('output_mtime')
+            )
+        except OSError:
+            return False
+
+    def forget_task(self, input_path: str):
+        """Drop a file's finished record so the next batch processes it again."""
+        with self._batch_lock:
+            state = self._load_batch_state()
+            if state.pop(input_path, None) is None:
+                return
+            try:
+                self._write_json(self._batch_state_path, {'schema': 1, 'tasks': dict(state)})
+            except OSError:
+                pass
+
     def get_incomplete_tasks(self) -> list[Checkpoint]:
         """Get list of incomplete checkpoints"""
         incomplete = []
@@ -197,6 +197,8 @@ class OCREngine:
         use_gpu: Optional[bool] = None,
         use_angle_cls: bool = True,
         quality: str = 'balanced',
+        batch_size: Optional[int] = None,
+        enable_hpi: bool = False,
     ):
         """
         Initialize OCR engine.
@@ -213,12 +215,20 @@ class OCREngine:
                 - 'fast': All mobile models, ~3x faster, good for most documents
                 - 'balanced': Mobile det + server rec, best quality/speed ratio
                 - 'high': All server models, highest accuracy, slowest
+            batch_size: Text lines recognized per inference call
+                (None → PaddleOCR's default). A page yields dozens of lines,
+                so batching amortizes the per-call model overhead.
+            enable_hpi: Use PaddleOCR's high-performance inference, which picks
+                an accelerated backend (OpenVINO / ONNX Runtime / TensorRT) for
+                the hardware. Needs the HPI plugin installed, so it is opt-in.
         """
         self.languages = languages or ['ch', 'en']
         self.model_dir = Path(model_dir) if model_dir else None
         self.use_gpu = use_gpu
         self.use_angle_cls = use_angle_cls
         self.quality = quality if quality in self.MODEL_CONFIGS else 'balanced'
+        self.batch_size = batch_size
+        self.enable_hpi = enable_hpi
         self._ocr = None
         self._device_str = ""
 
@@ -262,6 +272,11 @@ class OCREngine:
             'use_textline_orientation': True,       # 检测竖排/横排文字
             'device': self._device_str,
         }
+        if self.batch_size:
+            ocr_kwargs['text_recognition_batch_size'] = self.batch_size
+            ocr_kwargs['textline_orientation_batch_size'] = self.batch_size
+        if self.enable_hpi:
+            ocr_kwargs['enable_hpi'] = True
 
         # Disable oneDNN/MKL-DNN on PaddlePaddle 3.3.0+ to avoid PIR conversion bug.
         # (Paddle#77340: ArrayAttribute<DoubleAttribute> not supported in PIR→oneDNN)
@@ -29,12 +29,15 @@ from typing import Callable, Optional
 import cv2
 import numpy as np
 
-# NOTE: Do NOT force fork mode here. PaddlePaddle's internal threading/state
+# NOTE: Do NOT use fork mode here. PaddlePaddle's internal threading/state
 # corrupts after fork, causing the recognize() call to hang indefinitely.
-# The default 'spawn' mode on macOS Python 3.8+ and Windows works correctly
-# when run from a proper .py file (not stdin scripts).
-# For stdin scripts (e.g., `python << 'EOF' ... EOF`), spawn mode doesn't work
-# due to pickling issues, but that's not our use case for the desktop app.
+# 'spawn' is the default on macOS Python 3.8+ and Windows, but Linux defaults
+# to fork, so the pool asks for spawn explicitly. forkserver with Paddle
+# preloaded would fork a process that already imported Paddle, hitting the
+# same problem. Spawn works when run from a proper .py file (not stdin
+# scripts, e.g. `python << 'EOF' ... EOF`, which fail on pickling), which is
+# not our use case for the desktop app.
+_MP_CONTEXT = multiprocessing.get_context("spawn")
 
 _logger = logging.getLogger(__name__)
 
@@ -57,12 +60,26 @@ def _atexit_cleanup() -> None:
 atexit.register(_atexit_cleanup)
 
 
+def _available_cpus() -> int:
+    """Logical CPUs this process may run on.
+
+    Unlike os.cpu_count(), honours affinity masks and container CPU sets.
+    """
+    process_cpu_count = getattr(os, "process_cpu_count", None)  # Python 3.13+
+    if process_cpu_count is not None:
+        return process_cpu_count() or 1
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
 def _detect_optimal_workers() -> int:
     """
     Automatically detect optimal number of worker processes.
 
     Accounts for:
     - Physical CPU cores (not logical/hyperthreaded)
+    - CPU affinity / container CPU limits
     - Currently available system memory
     - Already-running OCR worker processes (avoids double-counting)
     - Conservative cap to prevent system instability on laptops
@@ -73,7 +90,8 @@ def _detect_optimal_workers() -> int:
     try:
         import psutil
 
-        cpu_count = psutil.cpu_count(logical=False) or 2
+        # Physical cores, but never more than the CPUs we are allowed to use
+        cpu_count = min(psutil.cpu_count(logical=False) or 2, _available_cpus())
 
         mem_info = psutil.virtual_memory()
         available_gb = mem_info.available / (1024 ** 3)
@@ -108,7 +126,10 @@ def _detect_optimal_workers() -> int:
         return max(1, min(memory_based, cpu_based, 2))
 
     except ImportError:
-        return 1
+        # No memory figures without psutil; estimate physical cores as half
+        # the usable logical CPUs (hyperthreading) and keep the same cap.
+        physical = max(1, _available_cpus() // 2)
+        return max(1, min(physical - 1, 2))
     except Exception:
         return 1
 
@@ -151,7 +172,8 @@ _process_ocr_engine = None
 _process_quality = None
 
 
-def _init_worker(quality: str, use_gpu=None):
+def _init_worker(quality: str, use_gpu=None, num_workers: int = 1,
+                 batch_size: Optional[int] = None):
     """
     Initialize OCR engine in worker process.
 
@@ -161,8 +183,18 @@ def _init_worker(quality: str, use_gpu=None):
     Args:
         quality: OCR quality mode ('fast', 'balanced', 'high')
         use_gpu: GPU override (None=auto, True=force GPU, False=force CPU)
+        num_workers: Size of the pool, used to split CPU threads between workers
+        batch_size: Text lines recognized per inference call (None → default)
     """
     global _process_ocr_engine, _process_quality
+
+    # Paddle's oneDNN/OpenMP pools default to one thread per CPU in every
+    # worker, oversubscribing the machine; give each worker its share.
+    # Must happen before Paddle is imported (spawned workers start clean).
+    threads = str(max(1, _available_cpus() // max(1, num_workers)))
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ.setdefault(var, threads)
+
     from core.ocr_engine import OCREngine
 
     _process_quality = quality
@@ -170,6 +202,7 @@ def _init_worker(quality: str, use_gpu=None):
         languages=['ch', 'en'],
         use_gpu=use_gpu,
         quality=quality,
+        batch_size=batch_size,
     )
 
 
@@ -282,10 +315,12 @@ class ParallelOCRProcessor:
         quality: str = 'balanced',
         num_workers: Optional[int] = None,
         use_gpu=None,
+        batch_size: Optional[int] = None,
     ):
         self.quality = quality
         self.num_workers = num_workers if num_workers is not None else _detect_optimal_workers()
         self.use_gpu = use_gpu
+        self.batch_size = batch_size
         self._executor: Optional[ProcessPoolExecutor] = None
         self._started = False
 
@@ -295,8 +330,9 @@ class ParallelOCRProcessor:
             return
         self._executor = ProcessPoolExecutor(
             max_workers=self.num_workers,
+            mp_context=_MP_CONTEXT,
             initializer=_init_worker,
-            initargs=(self.quality, self.use_gpu),
+            initargs=(self.quality, self.use_gpu, self.num_workers, self.batch_size),
         )
         self._started = True
         with _registry_lock:
@@ -1323,6 +1323,7 @@ class PDFProcessor:
                 parallel_processor = ParallelOCRProcessor(
                     quality=self.ocr_engine.quality if hasattr(self.ocr_engine, 'quality') else 'balanced',
                     num_workers=self.num_workers,
+                    batch_size=getattr(self.ocr_engine, 'batch_size', None),
                 )
                 parallel_processor.start()
 
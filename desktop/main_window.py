@@ -24,6 +24,7 @@ from .styles import (
     GLOBAL_STYLE, get_button_style, apply_card_shadow,
     COLORS, RADIUS
 )
+from core.checkpoint import get_checkpoint_manager
 from core.task_manager import Task, TaskStatus
 
 
@@ -381,8 +382,7 @@ class MainWindow(QMainWindow):
 
     def _show_settings(self):
         """Show settings dialog"""
-        dialog = SettingsDialog(self)
-        if dialog.exec():
+        if SettingsDialog.shared(self).exec():
             # Reload settings cache
             self._load_settings_cache()
 
@@ -476,6 +476,8 @@ class MainWindow(QMainWindow):
     def _on_reprocess_task(self, task_id: int):
         task = self._tasks.get(task_id)
         if task:
+            # An explicit reprocess must not be answered from the batch record
+            get_checkpoint_manager().forget_task(task.input_path)
             task.status = TaskStatus.PENDING
             task.progress = 0
             task.error_message = ""
@@ -527,6 +529,7 @@ class MainWindow(QMainWindow):
             image_mode=perf_settings.get('image_mode', 'lossy_85'),
             page_retry_limit=perf_settings.get('page_retry_limit', 2),
             allow_fallback_copy=perf_settings.get('allow_fallback_copy', True),
+            ocr_batch_size=perf_settings.get('ocr_batch_size'),
         )
 
         self._current_worker.progress.connect(self._on_progress)
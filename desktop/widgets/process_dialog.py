@@ -3,24 +3,95 @@ Process Dialog - Based on Pencil Design File
 Language selection grid with card-based layout
 """
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel,
+    QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel,
     QPushButton, QFrame, QWidget
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtGui import QFont
 
 from ..styles import COLORS, RADIUS, get_button_style
 
 
+# Pixel size and weight per text role. QFont objects need a QGuiApplication,
+# so they are created on first use and then shared by every dialog.
+_FONT_SPECS = {
+    'title': (18, QFont.Weight.DemiBold),
+    'section': (14, QFont.Weight.DemiBold),
+    'info': (13, QFont.Weight.Medium),
+    'info_icon': (16, QFont.Weight.Normal),
+    'card_icon': (22, QFont.Weight.Bold),
+    'card_text': (12, QFont.Weight.Medium),
+    'close': (12, QFont.Weight.Medium),
+}
+_fonts: dict[str, QFont] = {}
+
+
+def _font(role: str) -> QFont:
+    font = _fonts.get(role)
+    if font is None:
+        pixel_size, weight = _FONT_SPECS[role]
+        font = QFont()
+        font.setFamilies(["Helvetica Neue", "PingFang SC"])
+        font.setPixelSize(pixel_size)
+        font.setWeight(weight)
+        _fonts[role] = font
+    return font
+
+
+_DIALOG_STYLE = f"""
+    QLabel#dialogTitle {{
+        color: {COLORS['text_primary']};
+    }}
+    QPushButton#closeButton {{
+        background-color: {COLORS['bg_muted']};
+        color: {COLORS['text_secondary']};
+        border: none;
+        border-radius: 14px;
+    }}
+    QPushButton#closeButton:hover {{ background-color: {COLORS['border_subtle']}; }}
+    QFrame#infoCard {{
+        background-color: {COLORS['accent_light']};
+        border-radius: {RADIUS['md']}px;
+        border: none;
+    }}
+    QLabel#infoIcon, QLabel#infoText {{
+        color: {COLORS['accent_primary']};
+    }}
+    QLabel#sectionLabel {{
+        color: {COLORS['text_primary']};
+    }}
+    LanguageCard {{
+        background-color: {COLORS['bg_primary']};
+        border: 1px solid {COLORS['border_subtle']};
+        border-radius: {RADIUS['md']}px;
+    }}
+    LanguageCard[selected="true"] {{
+        background-color: {COLORS['accent_light']};
+        border: 2px solid {COLORS['accent_primary']};
+    }}
+    LanguageCard QLabel {{
+        border: none;
+        background: transparent;
+        color: {COLORS['text_secondary']};
+    }}
+    LanguageCard[selected="true"] QLabel {{
+        color: {COLORS['accent_primary']};
+    }}
+"""
+
+
 class LanguageCard(QFrame):
     """Language selection card"""
+
+    toggled = Signal(str, bool)  # lang_code, selected
     
-    def __init__(self, icon_text, label_text, lang_code, parent=None):
+    def __init__(self, icon_text, label_text, lang_code, initial_selected=False, parent=None):
         super().__init__(parent)
         self.lang_code = lang_code
-        self._selected = False
-        self._setup_ui(icon_text, label_text)
+        self._selected = None  # Unset, so the first set_selected() always applies
+        self._setup_ui(icon_text, label_text, initial_selected)
         
-    def _setup_ui(self, icon_text, label_text):
+    def _setup_ui(self, icon_text, label_text, initial_selected):
         self.setFixedHeight(80)
         self.setMinimumWidth(80)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -31,205 +102,148 @@ class LanguageCard(QFrame):
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         self.icon_label = QLabel(icon_text)
+        self.icon_label.setObjectName("cardIcon")
+        self.icon_label.setFont(_font('card_icon'))
         self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.icon_label.setStyleSheet(f"""
-            font-size: 22px;
-            font-weight: 700;
-            font-family: 'Helvetica Neue', 'PingFang SC';
-        """)
         
         self.text_label = QLabel(label_text)
+        self.text_label.setObjectName("cardText")
+        self.text_label.setFont(_font('card_text'))
         self.text_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.text_label.setStyleSheet(f"""
-            font-size: 12px;
-            font-weight: 500;
-            font-family: 'Helvetica Neue', 'PingFang SC';
-        """)
         
         layout.addWidget(self.icon_label)
         layout.addWidget(self.text_label)
         
-        self.set_selected(False)
+        self.set_selected(initial_selected)
         
     def set_selected(self, selected):
+        if selected == self._selected:
+            return
+        # Appearance comes from the dialog stylesheet's [selected] rules;
+        # re-polish so Qt re-evaluates them for the card and its labels.
         self._selected = selected
-        if selected:
-            self.setStyleSheet(f"""
-                LanguageCard {{
-                    background-color: {COLORS['accent_light']};
-                    border: 2px solid {COLORS['accent_primary']};
-                    border-radius: {RADIUS['md']}px;
-                }}
-                QLabel {{
-                    border: none;
-                    background: transparent;
-                }}
-            """)
-            self.icon_label.setStyleSheet(f"""
-                font-size: 22px;
-                font-weight: 700;
-                color: {COLORS['accent_primary']};
-                font-family: 'Helvetica Neue', 'PingFang SC';
-            """)
-            self.text_label.setStyleSheet(f"""
-                font-size: 12px;
-                font-weight: 500;
-                color: {COLORS['accent_primary']};
-                font-family: 'Helvetica Neue', 'PingFang SC';
-            """)
-        else:
-            self.setStyleSheet(f"""
-                LanguageCard {{
-                    background-color: {COLORS['bg_primary']};
-                    border: 1px solid {COLORS['border_subtle']};
-                    border-radius: {RADIUS['md']}px;
-                }}
-                QLabel {{
-                    border: none;
-                    background: transparent;
-                }}
-            """)
-            self.icon_label.setStyleSheet(f"""
-                font-size: 22px;
-                font-weight: 700;
-                color: {COLORS['text_secondary']};
-                font-family: 'Helvetica Neue', 'PingFang SC';
-            """)
-            self.text_label.setStyleSheet(f"""
-                font-size: 12px;
-                font-weight: 500;
-                color: {COLORS['text_secondary']};
-                font-family: 'Helvetica Neue', 'PingFang SC';
-            """)
+        self.setProperty("selected", selected)
+        style = self.style()
+        for widget in (self, self.icon_label, self.text_label):
+            style.unpolish(widget)
+            style.polish(widget)
     
     def is_selected(self):
         return self._selected
         
-    def mousePressEvent(self, event):
-        self.set_selected(not self._selected)
+    def mouseReleaseEvent(self, event):
+        # Toggle on release (like QAbstractButton) so dragging out cancels the click
+        if (event.button() == Qt.MouseButton.LeftButton
+                and self.rect().contains(event.position().toPoint())):
+            self.set_selected(not self._selected)
+            self.toggled.emit(self.lang_code, self._selected)
+        super().mouseReleaseEvent(event)
 
 
 class ProcessDialog(QDialog):
     """Dialog to select language before starting OCR processing."""
 
+    WIDTH = 380
+    # Content height does not depend on the file count, so the layout's size
+    # hint is computed for the first dialog and reused for later ones.
+    _fixed_height: int | None = None
+
     def __init__(self, file_count: int, parent=None):
         super().__init__(parent)
         self.setWindowTitle("开始处理")
         self.setModal(True)
-        self.setFixedWidth(380)
         self._file_count = file_count
+        self._selected_langs = {"ch"}
+        self.setStyleSheet(_DIALOG_STYLE)
         self._setup_ui()
-        self.adjustSize()
+        self.setFixedSize(self.WIDTH, self._get_fixed_height())
+
+    def _get_fixed_height(self) -> int:
+        cls = type(self)
+        if cls._fixed_height is None:
+            self.layout().activate()
+            cls._fixed_height = self.layout().sizeHint().height()
+        return cls._fixed_height
 
     def _setup_ui(self):
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(24, 24, 24, 24)
-        layout.setSpacing(20)
+        # Defer painting until every widget is in place
+        self.setUpdatesEnabled(False)
+
+        # Single grid for the whole dialog: the three language cards define the
+        # columns, everything else spans them. Base spacing is the 12px gap
+        # between the language label and cards; the empty 8px rows widen the
+        # gaps between sections to 20px.
+        grid = QGridLayout(self)
+        grid.setContentsMargins(24, 24, 24, 24)
+        grid.setHorizontalSpacing(10)
+        grid.setVerticalSpacing(12)
+        grid.setRowMinimumHeight(1, 8)
+        grid.setRowMinimumHeight(3, 8)
+        grid.setRowMinimumHeight(6, 8)
+        grid.setRowStretch(6, 1)
 
         # Header with title and close button
-        header = QHBoxLayout()
-        
         title = QLabel("开始处理")
-        title.setStyleSheet(f"""
-            font-size: 18px;
-            font-weight: 600;
-            color: {COLORS['text_primary']};
-            font-family: 'Helvetica Neue', 'PingFang SC';
-        """)
+        title.setObjectName("dialogTitle")
+        title.setFont(_font('title'))
         
         close_btn = QPushButton("✕")
+        close_btn.setObjectName("closeButton")
+        close_btn.setFont(_font('close'))
         close_btn.setFixedSize(28, 28)
-        close_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['bg_muted']};
-                color: {COLORS['text_secondary']};
-                border: none;
-                border-radius: 14px;
-                font-size: 12px;
-                font-weight: 500;
-            }}
-            QPushButton:hover {{ background-color: {COLORS['border_subtle']}; }}
-        """)
         close_btn.clicked.connect(self.reject)
         
-        header.addWidget(title)
-        header.addStretch()
-        header.addWidget(close_btn)
-        
-        layout.addLayout(header)
+        grid.addWidget(title, 0, 0, 1, 2)
+        grid.addWidget(close_btn, 0, 2, Qt.AlignmentFlag.AlignRight)
 
         # File count info card
         info_card = QFrame()
-        info_card.setStyleSheet(f"""
-            QFrame {{
-                background-color: {COLORS['accent_light']};
-                border-radius: {RADIUS['md']}px;
-                border: none;
-            }}
-        """)
+        info_card.setObjectName("infoCard")
         info_layout = QHBoxLayout(info_card)
         info_layout.setSpacing(8)
         info_layout.setContentsMargins(14, 10, 14, 10)
         
         file_icon = QLabel("📄")
-        file_icon.setStyleSheet(f"font-size: 16px; color: {COLORS['accent_primary']};")
+        file_icon.setObjectName("infoIcon")
+        file_icon.setFont(_font('info_icon'))
         
         file_text = QLabel(f"已选择 {self._file_count} 个文件待处理")
-        file_text.setStyleSheet(f"""
-            font-size: 13px;
-            font-weight: 500;
-            color: {COLORS['accent_primary']};
-            font-family: 'Helvetica Neue', 'PingFang SC';
-        """)
+        file_text.setObjectName("infoText")
+        file_text.setFont(_font('info'))
         
         info_layout.addWidget(file_icon)
         info_layout.addWidget(file_text)
         info_layout.addStretch()
         
-        layout.addWidget(info_card)
+        grid.addWidget(info_card, 2, 0, 1, 3)
 
         # Language section
-        lang_section = QVBoxLayout()
-        lang_section.setSpacing(12)
-
         lang_label = QLabel("识别语言")
-        lang_label.setStyleSheet(f"""
-            font-size: 14px;
-            font-weight: 600;
-            color: {COLORS['text_primary']};
-            font-family: 'Helvetica Neue', 'PingFang SC';
-        """)
-        lang_section.addWidget(lang_label)
+        lang_label.setObjectName("sectionLabel")
+        lang_label.setFont(_font('section'))
+        grid.addWidget(lang_label, 4, 0, 1, 3)
 
-        # Language grid
-        lang_grid = QHBoxLayout()
-        lang_grid.setSpacing(10)
-        
         self.lang_cards = {}
         
         # Chinese card (selected by default)
-        cn_card = LanguageCard("中", "中文", "ch")
-        cn_card.set_selected(True)
-        lang_grid.addWidget(cn_card)
+        cn_card = LanguageCard("中", "中文", "ch", initial_selected=True)
+        grid.addWidget(cn_card, 5, 0)
         self.lang_cards["ch"] = cn_card
         
         # English card
         en_card = LanguageCard("En", "英文", "en")
-        lang_grid.addWidget(en_card)
+        grid.addWidget(en_card, 5, 1)
         self.lang_cards["en"] = en_card
         
         # Japanese card
         jp_card = LanguageCard("日", "日文", "japan")
-        lang_grid.addWidget(jp_card)
+        grid.addWidget(jp_card, 5, 2)
         self.lang_cards["japan"] = jp_card
 
-        lang_section.addLayout(lang_grid)
-        
-        layout.addLayout(lang_section)
-        
-        layout.addStretch()
+        for card in self.lang_cards.values():
+            card.toggled.connect(self._on_card_toggled)
 
-        # Buttons
+        # Buttons (right-aligned row spanning every column)
         btn_row = QHBoxLayout()
         btn_row.setSpacing(10)
 
@@ -247,13 +261,19 @@ class ProcessDialog(QDialog):
         btn_row.addStretch()
         btn_row.addWidget(cancel_btn)
         btn_row.addWidget(start_btn)
+        grid.addLayout(btn_row, 7, 0, 1, 3)
+
+        self.setUpdatesEnabled(True)
 
-        layout.addLayout(btn_row)
+    @Slot(str, bool)
+    def _on_card_toggled(self, lang_code: str, selected: bool):
+        """Keep the selected-language set in sync with card toggles."""
+        if selected:
+            self._selected_langs.add(lang_code)
+        else:
+            self._selected_langs.discard(lang_code)
 
     def get_languages(self) -> list[str]:
         """Get selected languages."""
-        languages = []
-        for lang_code, card in self.lang_cards.items():
-            if card.is_selected():
-                languages.append(lang_code)
+        languages = [code for code in self.lang_cards if code in self._selected_langs]
         return languages if languages else ['ch']
@@ -2,62 +2,335 @@
 Settings Dialog - Based on Pencil Design File
 Card-based layout with DPI selector and toggle switches
 """
+import platform
 import threading
+from dataclasses import dataclass
 
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel,
+    QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel,
     QPushButton, QLineEdit, QFileDialog, QFrame,
-    QWidget, QComboBox, QScrollArea, QApplication
+    QWidget, QComboBox, QScrollArea, QApplication, QCheckBox, QButtonGroup
 )
-from PySide6.QtCore import Qt, QSettings, Signal
+from PySide6.QtCore import Qt, QSettings, QSignalBlocker, QTimer, Signal, QRectF
+from PySide6.QtGui import QPainter, QColor, QPixmap, QFont
 
 from ..styles import COLORS, RADIUS, get_button_style
 
 
-class ToggleSwitch(QWidget):
-    """Custom toggle switch widget with animated knob"""
+# Single stylesheet applied on the dialog; widgets pick their rules by object
+# name; state-dependent looks use pseudo-states or dynamic properties
+# (see _repolish). Label fonts are set as cached QFont objects instead; only
+# widgets whose font follows a pseudo-state or a type rule in GLOBAL_STYLE keep
+# font properties here.
+_FONT_FAMILY = "font-family: 'Helvetica Neue', 'PingFang SC';"
+
+_FONT_SPECS = {
+    'title': (18, QFont.Weight.DemiBold),
+    'close': (12, QFont.Weight.Medium),
+    'section': (14, QFont.Weight.DemiBold),
+    'row': (13, QFont.Weight.Medium),
+    'value': (13, QFont.Weight.Normal),
+    'chevron': (14, QFont.Weight.Normal),
+    'warning': (12, QFont.Weight.Normal),
+}
+_fonts: dict[str, QFont] = {}
+
+
+def _font(role: str) -> QFont:
+    font = _fonts.get(role)
+    if font is None:
+        pixel_size, weight = _FONT_SPECS[role]
+        font = QFont()
+        font.setFamilies(["Helvetica Neue", "PingFang SC"])
+        font.setPixelSize(pixel_size)
+        font.setWeight(weight)
+        _fonts[role] = font
+    return font
+
+
+_DIALOG_STYLE = f"""
+    QLabel#dialogTitle {{ color: {COLORS['text_primary']}; }}
+    QPushButton#closeButton {{
+        background-color: {COLORS['bg_muted']};
+        color: {COLORS['text_secondary']};
+        border: none;
+        border-radius: 14px;
+    }}
+    QPushButton#closeButton:hover {{ background-color: {COLORS['border_subtle']}; }}
+    QScrollArea#settingsScroll {{ border: none; background: transparent; }}
+    QWidget#scrollContent {{ background: transparent; }}
+    QLabel#sectionTitle {{ color: {COLORS['text_primary']}; }}
+    QFrame#settingsCard {{
+        background-color: {COLORS['bg_primary']};
+        border-radius: {RADIUS['md']}px;
+        border: none;
+    }}
+    QLabel#rowLabel {{ color: {COLORS['text_primary']}; }}
+    QFrame#separator {{ background-color: {COLORS['border_subtle']}; }}
+    QLabel#outputDirValue {{ color: {COLORS['text_tertiary']}; }}
+    QLabel#outputDirValue[custom="true"] {{ color: {COLORS['text_primary']}; }}
+    QPushButton#outputDirButton {{ background: transparent; border: none; padding: 0; }}
+    QLabel#chevron {{ color: {COLORS['text_tertiary']}; }}
+    QLineEdit#suffixEdit {{
+        background: {COLORS['bg_surface']};
+        border: 1px solid {COLORS['border_subtle']};
+        border-radius: 6px;
+        padding: 4px 8px;
+        font-size: 13px;
+        color: {COLORS['text_primary']};
+    }}
+    QComboBox#settingsCombo {{
+        background: {COLORS['bg_surface']};
+        border: 1px solid {COLORS['border_subtle']};
+        border-radius: 6px;
+        padding: 6px 10px;
+        font-size: 13px;
+        color: {COLORS['text_primary']};
+        {_FONT_FAMILY}
+    }}
+    QComboBox#settingsCombo:hover {{
+        border-color: {COLORS['accent_primary']};
+    }}
+    QComboBox#settingsCombo::drop-down {{
+        border: none;
+        width: 20px;
+    }}
+    QComboBox#settingsCombo::down-arrow {{
+        image: none;
+        border-left: 4px solid transparent;
+        border-right: 4px solid transparent;
+        border-top: 5px solid {COLORS['text_tertiary']};
+        margin-right: 8px;
+    }}
+    QComboBox#settingsCombo QAbstractItemView {{
+        background: {COLORS['bg_primary']};
+        border: 1px solid {COLORS['border_subtle']};
+        border-radius: 6px;
+        selection-background-color: {COLORS['accent_primary']};
+        selection-color: white;
+        padding: 4px;
+    }}
+    QLabel#hwStatus {{ color: {COLORS['text_secondary']}; }}
+    QLabel#hwStatus[accelerated="true"] {{ color: #2E7D32; }}
+    QLabel#hwWarning {{
+        color: #B8860B;
+        padding: 8px 12px;
+    }}
+    QPushButton#dpiButton {{
+        background-color: transparent;
+        color: {COLORS['text_tertiary']};
+        border: none;
+        border-radius: {RADIUS['sm']}px;
+        padding: 8px;
+        font-size: 13px;
+        font-weight: 500;
+        {_FONT_FAMILY}
+    }}
+    QPushButton#dpiButton:hover {{
+        background-color: {COLORS['bg_muted']};
+    }}
+    QPushButton#dpiButton:checked {{
+        background-color: {COLORS['bg_surface']};
+        color: {COLORS['text_primary']};
+        font-weight: 600;
+    }}
+"""
+
+# Footer button styles, looked up once per process
+_CANCEL_BUTTON_STYLE = get_button_style('secondary')
+_SAVE_BUTTON_STYLE = get_button_style('primary')
+
+
+def _data_index(combo: QComboBox) -> dict:
+    """Map each item's data to its index so saved values restore in O(1)."""
+    return {combo.itemData(i): i for i in range(combo.count())}
+
+
+def _repolish(widget):
+    """Re-evaluate stylesheet rules after a dynamic property change."""
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+def _coerce(value, kind):
+    """Convert a raw QSettings value to a field type (INI files store strings)."""
+    if kind is bool:
+        if isinstance(value, str):
+            return value.lower() not in ("false", "0", "")
+        return bool(value)
+    return kind(value)
+
+
+@dataclass
+class SettingsState:
+    """Values edited in SettingsDialog, with their defaults"""
+    suffix: str = "_ocr"
+    use_custom_output: bool = False
+    custom_path: str = ""
+    image_mode: str = "lossy_85"
+    dpi: str = "300"
+    skip_existing_text: bool = True
+    auto_open: bool = False
+    play_sound: bool = True
+    export_txt: bool = False
+    export_md: bool = False
+    export_md_images: bool = False
+    quality: str = "fast"
+    enable_variants: bool = True
+    gpu_override: str = "auto"
+
+    @classmethod
+    def load(cls, settings: QSettings) -> "SettingsState":
+        """Read every stored key once; missing keys keep their defaults."""
+        defaults = cls()
+        values = {}
+        for key in settings.allKeys():
+            name = _STATE_KEYS.get(key)
+            if name is not None:
+                values[name] = _coerce(settings.value(key), type(getattr(defaults, name)))
+        return cls(**values)
+
+    def to_settings(self) -> dict:
+        """Map the state back to QSettings keys."""
+        return {key: getattr(self, name) for key, name in _STATE_KEYS.items()}
+
+
+# QSettings key -> SettingsState field
+_STATE_KEYS = {
+    "output/suffix": "suffix",
+    "output/use_custom": "use_custom_output",
+    "output/custom_path": "custom_path",
+    "output/image_mode": "image_mode",
+    "quality/dpi": "dpi",
+    "options/skip_existing_text": "skip_existing_text",
+    "options/auto_open": "auto_open",
+    "options/play_sound": "play_sound",
+    "export/txt": "export_txt",
+    "export/md": "export_md",
+    "export/md_images": "export_md_images",
+    "performance/quality": "quality",
+    "ocr/enable_variants": "enable_variants",
+    "performance/gpu_override": "gpu_override",
+}
+
+# Toggle widget name -> SettingsState field
+_TOGGLE_FIELDS = {
+    "skip_text_toggle": "skip_existing_text",
+    "auto_open_toggle": "auto_open",
+    "sound_toggle": "play_sound",
+    "export_txt_toggle": "export_txt",
+    "export_md_toggle": "export_md",
+    "export_md_images_toggle": "export_md_images",
+    "variants_toggle": "enable_variants",
+}
+
+
+class ToggleSwitch(QCheckBox):
+    """Checkbox drawn as a toggle switch; state handling is QCheckBox's own"""
+
+    # Rendered switch images keyed by (checked, device pixel ratio), shared
+    # by all instances so a repaint is a single pixmap blit.
+    _pixmaps = {}
+
+    _TRACK_ON = QColor(COLORS['accent_primary'])
+    _TRACK_OFF = QColor(COLORS['bg_muted'])
+    _KNOB = QColor("#FFFFFF")
+    # Switches only sit on settings cards; pre-filling the corners with the
+    # card color makes the image opaque, so Qt can skip erasing behind it.
+    _BACKGROUND = QColor(COLORS['bg_primary'])
+    _TRACK_RECT = QRectF(0, 0, 44, 24)
+    _KNOB_ON = QRectF(22, 2, 20, 20)
+    _KNOB_OFF = QRectF(2, 2, 20, 20)
 
     def __init__(self, checked=True, parent=None):
         super().__init__(parent)
-        self._checked = checked
+        self.setChecked(checked)
         self.setFixedSize(44, 24)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
-    def paintEvent(self, event):
-        from PySide6.QtGui import QPainter, QColor, QPen
-        from PySide6.QtCore import QRectF
-
-        painter = QPainter(self)
+    @classmethod
+    def _pixmap(cls, checked, dpr):
+        key = (checked, dpr)
+        pixmap = cls._pixmaps.get(key)
+        if pixmap is None:
+            pixmap = cls._render(checked, dpr)
+            cls._pixmaps[key] = pixmap
+        return pixmap
+
+    @classmethod
+    def _render(cls, checked, dpr):
+        pixmap = QPixmap(round(44 * dpr), round(24 * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(cls._BACKGROUND)
+
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Track
-        track_color = QColor(COLORS['accent_primary']) if self._checked else QColor(COLORS['bg_muted'])
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(track_color)
-        painter.drawRoundedRect(QRectF(0, 0, 44, 24), 12, 12)
+        painter.setBrush(cls._TRACK_ON if checked else cls._TRACK_OFF)
+        painter.drawRoundedRect(cls._TRACK_RECT, 12, 12)
 
         # Knob (white circle)
-        painter.setBrush(QColor("#FFFFFF"))
-        knob_x = 22.0 if self._checked else 2.0
-        painter.drawEllipse(QRectF(knob_x, 2, 20, 20))
+        painter.setBrush(cls._KNOB)
+        painter.drawEllipse(cls._KNOB_ON if checked else cls._KNOB_OFF)
 
         painter.end()
+        return pixmap
 
-    def mousePressEvent(self, event):
-        self._checked = not self._checked
-        self.update()
-
-    def isChecked(self):
-        return self._checked
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._pixmap(self.isChecked(), self.devicePixelRatioF()))
+        painter.end()
 
-    def setChecked(self, checked):
-        self._checked = checked
-        self.update()
+    def hitButton(self, pos):
+        # The whole switch is clickable, not just the style's indicator area
+        return self.rect().contains(pos)
 
 
 class SettingsDialog(QDialog):
     """Modal settings dialog matching the design file."""
-    hardware_status_ready = Signal(str, str, str)
+    hardware_status_ready = Signal(str, bool, str)  # status, accelerated, warnings
+
+    # Hardware does not change while the app runs, so the last successful
+    # probe (status, accelerated, warnings) is shared by every dialog in the
+    # process until settings are saved.
+    _hardware_status: tuple[str, bool, str] | None = None
+
+    # At most one probe runs at a time; it reports to the dialog that asked last
+    _hardware_probe: threading.Thread | None = None
+    _hardware_listener: "SettingsDialog | None" = None
+
+    # Process-wide instance handed out by shared()
+    _instance: "SettingsDialog | None" = None
+
+    @classmethod
+    def shared(cls, parent=None) -> "SettingsDialog":
+        """Return the process-wide dialog, reparented and reloaded for this open.
+
+        Building the dialog is the expensive part of opening it, so it is
+        built once and only its values are refreshed on later opens.
+        """
+        dialog = cls._instance
+        if dialog is None:
+            dialog = cls(parent)
+            cls._instance = dialog
+            dialog.destroyed.connect(cls._forget_instance)
+            return dialog
+
+        if dialog.parent() is not parent:
+            # setParent() resets window flags; keep the dialog a dialog
+            dialog.setParent(parent, dialog.windowFlags())
+        # Discard edits left over from a cancelled session
+        dialog._load_settings()
+        return dialog
+
+    @classmethod
+    def _forget_instance(cls):
+        cls._instance = None
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -65,41 +338,72 @@ class SettingsDialog(QDialog):
         self.setModal(True)
         self.setFixedWidth(460)
         self.hardware_status_ready.connect(self._apply_hardware_status)
+        self.setStyleSheet(_DIALOG_STYLE)
+        # Widgets are created with the saved values already in place
+        self._settings = QSettings("SmartOCR", "OCRTool")
+        self._state = SettingsState.load(self._settings)
         self._setup_ui()
-        self._load_settings()
         self._adjust_height()
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Probe hardware only once the dialog is actually on screen; while the
+        # hardware section is still pending, building it starts the probe.
+        if self._build_hw_section not in self._pending_sections:
+            self._refresh_hardware_status()
+
     def _create_card(self):
         """Create a card container"""
         card = QFrame()
-        card.setStyleSheet(f"""
-            QFrame {{
-                background-color: {COLORS['bg_primary']};
-                border-radius: {RADIUS['md']}px;
-                border: none;
-            }}
-        """)
+        card.setObjectName("settingsCard")
         return card
 
-    def _create_row(self, label_text, widget):
-        """Create a settings row with label and widget"""
-        row = QHBoxLayout()
-        row.setSpacing(12)
-        row.setContentsMargins(12, 12, 12, 12)
-        
+    def _make_sep(self):
+        """Create a 1px separator line styled by the dialog stylesheet"""
+        sep = QFrame()
+        sep.setFixedHeight(1)
+        sep.setObjectName("separator")
+        return sep
+
+    def _create_form_card(self):
+        """Create a card whose rows all live in one grid layout.
+
+        Columns 0 and 2 are the 12px side padding, so separators spanning
+        every column stay full-bleed; the vertical spacing is the row padding.
+        """
+        card = self._create_card()
+        form = QGridLayout(card)
+        form.setContentsMargins(0, 12, 0, 12)
+        form.setHorizontalSpacing(0)
+        form.setVerticalSpacing(12)
+        form.setColumnMinimumWidth(0, 12)
+        form.setColumnStretch(1, 1)
+        form.setColumnMinimumWidth(2, 12)
+        return card, form
+
+    def _add_form_row(self, form, label_text, widget):
+        """Append a label/widget row, preceded by a separator unless first.
+
+        Label and widget share the content cell, pinned to opposite edges, so
+        a long label in one row does not widen the widget column of another.
+        """
+        row = form.rowCount() if form.count() else 0
+        if row:
+            form.addWidget(self._make_sep(), row, 0, 1, 3)
+            row += 1
+
         label = QLabel(label_text)
-        label.setStyleSheet(f"""
-            font-size: 13px;
-            font-weight: 500;
-            color: {COLORS['text_primary']};
-            font-family: 'Helvetica Neue', 'PingFang SC';
-        """)
-        
-        row.addWidget(label)
-        row.addStretch()
-        row.addWidget(widget)
-        
-        return row
+        label.setObjectName("rowLabel")
+        label.setFont(_font('row'))
+        form.addWidget(label, row, 1, Qt.AlignmentFlag.AlignLeft)
+        form.addWidget(widget, row, 1, Qt.AlignmentFlag.AlignRight)
+
+    def _add_toggle_rows(self, form, toggles):
+        """Append a switch row per (name, label), checked from the loaded state."""
+        for name, label in toggles:
+            toggle = ToggleSwitch(checked=getattr(self._state, _TOGGLE_FIELDS[name]))
+            self.toggles[name] = toggle
+            self._add_form_row(form, label, toggle)
 
     def _adjust_height(self):
         """Fit dialog height to screen, enabling scroll if content is taller."""
@@ -110,9 +414,13 @@ class SettingsDialog(QDialog):
         else:
             max_h = 700
 
-        self.adjustSize()
-        if self.height() > max_h:
+        # Size from the layout's hint rather than adjustSize(), which runs a
+        # full layout and geometry pass before the dialog is ever shown
+        hinted = self.sizeHint().height()
+        if hinted > max_h:
             self.setFixedHeight(max_h)
+        else:
+            self.resize(self.width(), hinted)
 
     def _setup_ui(self):
         # Outer layout: header (fixed) + scroll area + buttons (fixed)
@@ -120,181 +428,146 @@ class SettingsDialog(QDialog):
         outer.setContentsMargins(24, 24, 24, 24)
         outer.setSpacing(0)
 
-        # ── Header (always visible, not scrollable) ──────────────────────
-        header = QHBoxLayout()
-        header.setContentsMargins(0, 0, 0, 16)
-
-        title = QLabel("设置")
-        title.setStyleSheet(f"""
-            font-size: 18px;
-            font-weight: 600;
-            color: {COLORS['text_primary']};
-            font-family: 'Helvetica Neue', 'PingFang SC';
-        """)
-
-        close_btn = QPushButton("✕")
-        close_btn.setFixedSize(28, 28)
-        close_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['bg_muted']};
-                color: {COLORS['text_secondary']};
-                border: none;
-                border-radius: 14px;
-                font-size: 12px;
-                font-weight: 500;
-            }}
-            QPushButton:hover {{ background-color: {COLORS['border_subtle']}; }}
-        """)
-        close_btn.clicked.connect(self.reject)
-
-        header.addWidget(title)
-        header.addStretch()
-        header.addWidget(close_btn)
-        outer.addLayout(header)
+        self._build_header(outer)
 
         # ── Scroll area wrapping all settings sections ────────────────────
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.Shape.NoFrame)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
+        scroll.setObjectName("settingsScroll")
 
         scroll_content = QWidget()
-        scroll_content.setStyleSheet("background: transparent;")
+        scroll_content.setObjectName("scrollContent")
         layout = QVBoxLayout(scroll_content)
         layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(20)
+        # Titles sit 12px above their card; sections are 20px apart
+        layout.setSpacing(12)
+        self._content_layout = layout
 
         scroll.setWidget(scroll_content)
         outer.addWidget(scroll, 1)  # stretch = 1 so it fills remaining space
 
-        # ============ Output Section ============
-        output_section = QVBoxLayout()
-        output_section.setSpacing(12)
+        # Build what fills the first screen of the scroll area now; the scroll
+        # area caps its size hint well below the full content, so this is
+        # also enough to size the dialog.
+        self.toggles = {}
+        self._build_output_section(layout)
+        self._build_quality_section(layout)
+        self._build_export_section(layout)
+
+        # The sections below the fold are built from the event loop, one per
+        # iteration, so the dialog can come up without waiting for them.
+        self._pending_sections = [
+            self._build_perf_section,
+            self._build_hw_section,
+            self._build_options_section,
+        ]
+        QTimer.singleShot(0, self._build_next_section)
+
+        self._build_buttons(outer)
+
+    def _build_next_section(self):
+        """Build one deferred section and schedule the next."""
+        if self._pending_sections:
+            self._build_section(self._pending_sections.pop(0))
+            QTimer.singleShot(0, self._build_next_section)
+
+    def _finish_sections(self):
+        """Build every still-deferred section now (before reading widgets)."""
+        while self._pending_sections:
+            self._build_section(self._pending_sections.pop(0))
+
+    def _build_section(self, build):
+        # Deferred sections are added while the dialog is on screen; hold
+        # repaints until the whole card is in place.
+        content = self._content_layout.parentWidget()
+        content.setUpdatesEnabled(False)
+        build(self._content_layout)
+        if not self._pending_sections:
+            self._content_layout.addStretch()
+        content.setUpdatesEnabled(True)
+
+    def _build_header(self, outer):
+        # ── Header (always visible, not scrollable) ──────────────────────
+        header = QHBoxLayout()
+        header.setContentsMargins(0, 0, 0, 16)
+
+        title = QLabel("设置")
+        title.setObjectName("dialogTitle")
+        title.setFont(_font('title'))
+
+        close_btn = QPushButton("✕")
+        close_btn.setFixedSize(28, 28)
+        close_btn.setObjectName("closeButton")
+        close_btn.setFont(_font('close'))
+        close_btn.clicked.connect(self.reject)
+
+        header.addWidget(title)
+        header.addStretch()
+        header.addWidget(close_btn)
+        outer.addLayout(header)
 
+    def _build_output_section(self, layout):
         section_title = QLabel("输出设置")
-        section_title.setStyleSheet(f"""
-            font-size: 14px;
-            font-weight: 600;
-            color: {COLORS['text_primary']};
-            font-family: 'Helvetica Neue', 'PingFang SC';
-        """)
-        output_section.addWidget(section_title)
+        section_title.setObjectName("sectionTitle")
+        section_title.setFont(_font('section'))
+        layout.addWidget(section_title)
 
         # Output directory card
-        output_card = self._create_card()
-        output_layout = QVBoxLayout(output_card)
-        output_layout.setSpacing(0)
-        output_layout.setContentsMargins(0, 0, 0, 0)
+        output_card, output_form = self._create_form_card()
 
         # Output dir row
-        self.output_dir_value = QLabel("与源文件相同")
-        self.output_dir_value.setStyleSheet(f"""
-            font-size: 13px;
-            color: {COLORS['text_tertiary']};
-            font-family: 'Helvetica Neue', 'PingFang SC';
-        """)
-        
-        output_dir_widget = QWidget()
-        output_dir_layout = QHBoxLayout(output_dir_widget)
+        self.output_dir_value = QLabel()
+        self.output_dir_value.setObjectName("outputDirValue")
+        self.output_dir_value.setFont(_font('value'))
+        self._set_output_dir(self._state.custom_path if self._state.use_custom_output else "")
+
+        output_dir_btn = QPushButton()
+        output_dir_btn.setObjectName("outputDirButton")
+        output_dir_layout = QHBoxLayout(output_dir_btn)
         output_dir_layout.setSpacing(4)
         output_dir_layout.setContentsMargins(0, 0, 0, 0)
+        # QPushButton's own sizeHint ignores child widgets; let the layout
+        # size the button so it still grows with the chosen path.
+        output_dir_layout.setSizeConstraint(QHBoxLayout.SizeConstraint.SetMinimumSize)
         output_dir_layout.addWidget(self.output_dir_value)
         chevron = QLabel("›")
-        chevron.setStyleSheet(f"color: {COLORS['text_tertiary']}; font-size: 14px;")
+        chevron.setObjectName("chevron")
+        chevron.setFont(_font('chevron'))
         output_dir_layout.addWidget(chevron)
         
-        output_dir_widget.setCursor(Qt.CursorShape.PointingHandCursor)
-        output_dir_widget.mousePressEvent = lambda e: self._browse_dir()
-
-        output_dir_row = self._create_row("输出目录", output_dir_widget)
-        output_layout.addLayout(output_dir_row)
+        output_dir_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        output_dir_btn.clicked.connect(self._browse_dir)
 
-        # Separator
-        separator = QFrame()
-        separator.setFixedHeight(1)
-        separator.setStyleSheet(f"background-color: {COLORS['border_subtle']};")
-        output_layout.addWidget(separator)
+        self._add_form_row(output_form, "输出目录", output_dir_btn)
 
         # Suffix row
-        self.suffix_edit = QLineEdit("_ocr")
+        self.suffix_edit = QLineEdit(self._state.suffix)
         self.suffix_edit.setFixedWidth(80)
-        self.suffix_edit.setStyleSheet(f"""
-            QLineEdit {{
-                background: {COLORS['bg_surface']};
-                border: 1px solid {COLORS['border_subtle']};
-                border-radius: 6px;
-                padding: 4px 8px;
-                font-size: 13px;
-                color: {COLORS['text_primary']};
-            }}
-        """)
+        self.suffix_edit.setObjectName("suffixEdit")
         
-        suffix_row = self._create_row("文件后缀", self.suffix_edit)
-        output_layout.addLayout(suffix_row)
-
-        # Separator
-        output_separator = QFrame()
-        output_separator.setFixedHeight(1)
-        output_separator.setStyleSheet(f"background-color: {COLORS['border_subtle']};")
-        output_layout.addWidget(output_separator)
+        self._add_form_row(output_form, "文件后缀", self.suffix_edit)
 
         self.image_mode_combo = QComboBox()
         self.image_mode_combo.addItem("标准压缩 (推荐，速度快，体积小)", "lossy_85")
         self.image_mode_combo.addItem("无损画质 (体积大，写入较慢)", "lossless")
         self.image_mode_combo.setFixedWidth(280)
-        self.image_mode_combo.setStyleSheet(f"""
-            QComboBox {{
-                background: {COLORS['bg_surface']};
-                border: 1px solid {COLORS['border_subtle']};
-                border-radius: 6px;
-                padding: 6px 10px;
-                font-size: 13px;
-                color: {COLORS['text_primary']};
-                font-family: 'Helvetica Neue', 'PingFang SC';
-            }}
-            QComboBox:hover {{
-                border-color: {COLORS['accent_primary']};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                width: 20px;
-            }}
-            QComboBox::down-arrow {{
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 5px solid {COLORS['text_tertiary']};
-                margin-right: 8px;
-            }}
-            QComboBox QAbstractItemView {{
-                background: {COLORS['bg_primary']};
-                border: 1px solid {COLORS['border_subtle']};
-                border-radius: 6px;
-                selection-background-color: {COLORS['accent_primary']};
-                selection-color: white;
-                padding: 4px;
-            }}
-        """)
-
-        image_mode_row = self._create_row("输出图像", self.image_mode_combo)
-        output_layout.addLayout(image_mode_row)
-
-        output_section.addWidget(output_card)
-        layout.addLayout(output_section)
-
-        # ============ Quality Section ============
-        quality_section = QVBoxLayout()
-        quality_section.setSpacing(12)
+        self._image_mode_index = _data_index(self.image_mode_combo)
+        self.image_mode_combo.setCurrentIndex(self._image_mode_index.get(self._state.image_mode, 0))
+        self.image_mode_combo.setObjectName("settingsCombo")
+
+        self._add_form_row(output_form, "输出图像", self.image_mode_combo)
+
+        layout.addWidget(output_card)
+
+    def _build_quality_section(self, layout):
+        layout.addSpacing(8)
 
         quality_title = QLabel("识别质量")
-        quality_title.setStyleSheet(f"""
-            font-size: 14px;
-            font-weight: 600;
-            color: {COLORS['text_primary']};
-            font-family: 'Helvetica Neue', 'PingFang SC';
-        """)
-        quality_section.addWidget(quality_title)
+        quality_title.setObjectName("sectionTitle")
+        quality_title.setFont(_font('section'))
+        layout.addWidget(quality_title)
 
         # DPI selector card
         dpi_card = self._create_card()
@@ -304,333 +577,146 @@ class SettingsDialog(QDialog):
 
         self.dpi_buttons = {}
         dpi_values = ["150", "200", "300", "400"]
-        
+        # Exclusive group: checking one button unchecks the previous one
+        self._dpi_group = QButtonGroup(self)
+
         for i, dpi in enumerate(dpi_values):
             btn = QPushButton(dpi)
+            btn.setObjectName("dpiButton")
             btn.setCheckable(True)
             btn.setFixedHeight(36)
-            btn.setProperty("dpi", dpi)
-            btn.clicked.connect(self._on_dpi_clicked)
+            self._dpi_group.addButton(btn, int(dpi))
             dpi_layout.addWidget(btn)
             self.dpi_buttons[dpi] = btn
 
-        # Set default
-        self.dpi_buttons["300"].setChecked(True)
-        self._update_dpi_styles()
-
-        quality_section.addWidget(dpi_card)
-        layout.addLayout(quality_section)
+        # Saved DPI, or the 300 default
+        dpi = self._state.dpi if self._state.dpi in self.dpi_buttons else "300"
+        self.dpi_buttons[dpi].setChecked(True)
 
-        # Initialize toggles dict
-        self.toggles = {}
+        layout.addWidget(dpi_card)
 
-        # ============ Export Formats Section ============
-        export_section = QVBoxLayout()
-        export_section.setSpacing(12)
+    def _build_export_section(self, layout):
+        layout.addSpacing(8)
 
         export_title = QLabel("额外输出格式")
-        export_title.setStyleSheet(f"""
-            font-size: 14px;
-            font-weight: 600;
-            color: {COLORS['text_primary']};
-            font-family: 'Helvetica Neue', 'PingFang SC';
-        """)
-        export_section.addWidget(export_title)
+        export_title.setObjectName("sectionTitle")
+        export_title.setFont(_font('section'))
+        layout.addWidget(export_title)
 
         # Export formats card
-        export_card = self._create_card()
-        export_layout = QVBoxLayout(export_card)
-        export_layout.setSpacing(0)
-        export_layout.setContentsMargins(0, 0, 0, 0)
+        export_card, export_form = self._create_form_card()
 
         # Export format toggles
         export_toggles = [
-            ("export_txt_toggle", "纯文本 (.txt)", False),
-            ("export_md_toggle", "Markdown (.md)", False),
-            ("export_md_images_toggle", "Markdown + 图片 (.md)", False),
+            ("export_txt_toggle", "纯文本 (.txt)"),
+            ("export_md_toggle", "Markdown (.md)"),
+            ("export_md_images_toggle", "Markdown + 图片 (.md)"),
         ]
 
-        for i, (name, label, default) in enumerate(export_toggles):
-            if i > 0:
-                sep = QFrame()
-                sep.setFixedHeight(1)
-                sep.setStyleSheet(f"background-color: {COLORS['border_subtle']};")
-                export_layout.addWidget(sep)
-
-            toggle_widget = QWidget()
-            toggle_layout = QHBoxLayout(toggle_widget)
-            toggle_layout.setSpacing(12)
-            toggle_layout.setContentsMargins(12, 12, 12, 12)
-
-            label_widget = QLabel(label)
-            label_widget.setStyleSheet(f"""
-                font-size: 13px;
-                font-weight: 500;
-                color: {COLORS['text_primary']};
-                font-family: 'Helvetica Neue', 'PingFang SC';
-            """)
-
-            toggle = ToggleSwitch(checked=default)
-            self.toggles[name] = toggle
-
-            toggle_layout.addWidget(label_widget)
-            toggle_layout.addStretch()
-            toggle_layout.addWidget(toggle)
-
-            export_layout.addWidget(toggle_widget)
+        self._add_toggle_rows(export_form, export_toggles)
 
-        export_section.addWidget(export_card)
-        layout.addLayout(export_section)
+        layout.addWidget(export_card)
 
-        # ============ Performance Settings Section ============
-        perf_section = QVBoxLayout()
-        perf_section.setSpacing(12)
+    def _build_perf_section(self, layout):
+        layout.addSpacing(8)
 
         perf_title = QLabel("性能设置")
-        perf_title.setStyleSheet(f"""
-            font-size: 14px;
-            font-weight: 600;
-            color: {COLORS['text_primary']};
-            font-family: 'Helvetica Neue', 'PingFang SC';
-        """)
-        perf_section.addWidget(perf_title)
+        perf_title.setObjectName("sectionTitle")
+        perf_title.setFont(_font('section'))
+        layout.addWidget(perf_title)
 
         # Performance settings card
-        perf_card = self._create_card()
-        perf_layout = QVBoxLayout(perf_card)
-        perf_layout.setSpacing(0)
-        perf_layout.setContentsMargins(0, 0, 0, 0)
+        perf_card, perf_form = self._create_form_card()
 
         # Quality mode combo box (only fast and balanced; high removed for stability)
         self.quality_combo = QComboBox()
         self.quality_combo.addItem("快速 (Fast) - 推荐，速度快，适合大批量", "fast")
         self.quality_combo.addItem("平衡 (Balanced) - 兼顾速度和准确率", "balanced")
-        self.quality_combo.setCurrentIndex(0)  # Default: fast
         self.quality_combo.setFixedWidth(280)
-        self.quality_combo.setStyleSheet(f"""
-            QComboBox {{
-                background: {COLORS['bg_surface']};
-                border: 1px solid {COLORS['border_subtle']};
-                border-radius: 6px;
-                padding: 6px 10px;
-                font-size: 13px;
-                color: {COLORS['text_primary']};
-                font-family: 'Helvetica Neue', 'PingFang SC';
-            }}
-            QComboBox:hover {{
-                border-color: {COLORS['accent_primary']};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                width: 20px;
-            }}
-            QComboBox::down-arrow {{
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 5px solid {COLORS['text_tertiary']};
-                margin-right: 8px;
-            }}
-            QComboBox QAbstractItemView {{
-                background: {COLORS['bg_primary']};
-                border: 1px solid {COLORS['border_subtle']};
-                border-radius: 6px;
-                selection-background-color: {COLORS['accent_primary']};
-                selection-color: white;
-                padding: 4px;
-            }}
-        """)
-
-        quality_row = self._create_row("识别质量", self.quality_combo)
-        perf_layout.addLayout(quality_row)
-
-        # Separator
-        sep_perf = QFrame()
-        sep_perf.setFixedHeight(1)
-        sep_perf.setStyleSheet(f"background-color: {COLORS['border_subtle']};")
-        perf_layout.addWidget(sep_perf)
+        self._quality_index = _data_index(self.quality_combo)
+        # "high" was removed from the UI; saved "high" restores as "balanced"
+        self._quality_index["high"] = self._quality_index["balanced"]
+        self.quality_combo.setCurrentIndex(self._quality_index.get(self._state.quality, 0))
+        self.quality_combo.setObjectName("settingsCombo")
 
-        # Variant character normalization toggle
-        variants_widget = QWidget()
-        variants_layout = QHBoxLayout(variants_widget)
-        variants_layout.setSpacing(12)
-        variants_layout.setContentsMargins(12, 12, 12, 12)
-
-        variants_label = QLabel('异体字归并（搜\u201c藏\u201d也能找到\u201c蔵\u201d）')
-        variants_label.setStyleSheet(f"""
-            font-size: 13px;
-            font-weight: 500;
-            color: {COLORS['text_primary']};
-            font-family: 'Helvetica Neue', 'PingFang SC';
-        """)
+        self._add_form_row(perf_form, "识别质量", self.quality_combo)
 
-        self.toggles["variants_toggle"] = ToggleSwitch(checked=True)
+        # Variant character normalization toggle
+        self.toggles["variants_toggle"] = ToggleSwitch(checked=self._state.enable_variants)
+        self._add_form_row(
+            perf_form,
+            '异体字归并（搜\u201c藏\u201d也能找到\u201c蔵\u201d）',
+            self.toggles["variants_toggle"],
+        )
 
-        variants_layout.addWidget(variants_label)
-        variants_layout.addStretch()
-        variants_layout.addWidget(self.toggles["variants_toggle"])
+        layout.addWidget(perf_card)
 
-        perf_layout.addWidget(variants_widget)
+    def _build_hw_section(self, layout):
+        layout.addSpacing(8)
 
-        perf_section.addWidget(perf_card)
-        layout.addLayout(perf_section)
+        hw_title = QLabel("硬件加速")
+        hw_title.setObjectName("sectionTitle")
+        hw_title.setFont(_font('section'))
+        layout.addWidget(hw_title)
 
-        # ============ Hardware Acceleration Section ============
-        hw_section = QVBoxLayout()
-        hw_section.setSpacing(12)
+        hw_card, hw_form = self._create_form_card()
 
-        hw_title = QLabel("硬件加速")
-        hw_title.setStyleSheet(f"""
-            font-size: 14px;
-            font-weight: 600;
-            color: {COLORS['text_primary']};
-            font-family: 'Helvetica Neue', 'PingFang SC';
-        """)
-        hw_section.addWidget(hw_title)
-
-        hw_card = self._create_card()
-        hw_layout = QVBoxLayout(hw_card)
-        hw_layout.setSpacing(0)
-        hw_layout.setContentsMargins(0, 0, 0, 0)
-
-        # Hardware status label (populated at load time)
+        # Hardware status label (populated once the dialog is shown)
         self.hw_status_label = QLabel("检测中…")
-        self.hw_status_label.setStyleSheet(f"""
-            font-size: 13px;
-            color: {COLORS['text_secondary']};
-            font-family: 'Helvetica Neue', 'PingFang SC';
-        """)
-        hw_status_row = self._create_row("当前硬件", self.hw_status_label)
-        hw_layout.addLayout(hw_status_row)
-
-        # Separator
-        sep_hw = QFrame()
-        sep_hw.setFixedHeight(1)
-        sep_hw.setStyleSheet(f"background-color: {COLORS['border_subtle']};")
-        hw_layout.addWidget(sep_hw)
+        self.hw_status_label.setObjectName("hwStatus")
+        self.hw_status_label.setFont(_font('value'))
+        self._add_form_row(hw_form, "当前硬件", self.hw_status_label)
 
         # GPU override combo box
         self.gpu_combo = QComboBox()
         self.gpu_combo.addItem("自动检测 (推荐)", "auto")
         self.gpu_combo.addItem("强制 CPU", "cpu")
         self.gpu_combo.addItem("强制 GPU", "gpu")
-        self.gpu_combo.setCurrentIndex(0)
         self.gpu_combo.setFixedWidth(200)
-        self.gpu_combo.setStyleSheet(f"""
-            QComboBox {{
-                background: {COLORS['bg_surface']};
-                border: 1px solid {COLORS['border_subtle']};
-                border-radius: 6px;
-                padding: 6px 10px;
-                font-size: 13px;
-                color: {COLORS['text_primary']};
-                font-family: 'Helvetica Neue', 'PingFang SC';
-            }}
-            QComboBox:hover {{
-                border-color: {COLORS['accent_primary']};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                width: 20px;
-            }}
-            QComboBox::down-arrow {{
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 5px solid {COLORS['text_tertiary']};
-                margin-right: 8px;
-            }}
-            QComboBox QAbstractItemView {{
-                background: {COLORS['bg_primary']};
-                border: 1px solid {COLORS['border_subtle']};
-                border-radius: 6px;
-                selection-background-color: {COLORS['accent_primary']};
-                selection-color: white;
-                padding: 4px;
-            }}
-        """)
-        gpu_row = self._create_row("计算设备", self.gpu_combo)
-        hw_layout.addLayout(gpu_row)
+        self._gpu_index = _data_index(self.gpu_combo)
+        self.gpu_combo.setCurrentIndex(self._gpu_index.get(self._state.gpu_override, 0))
+        self.gpu_combo.setObjectName("settingsCombo")
+        self._add_form_row(hw_form, "计算设备", self.gpu_combo)
         # Warning label (shown only when hardware has warnings)
         self.hw_warning_label = QLabel("")
         self.hw_warning_label.setWordWrap(True)
-        self.hw_warning_label.setStyleSheet(f"""
-            font-size: 12px;
-            color: #B8860B;
-            padding: 8px 12px;
-            font-family: 'Helvetica Neue', 'PingFang SC';
-        """)
+        self.hw_warning_label.setObjectName("hwWarning")
+        self.hw_warning_label.setFont(_font('warning'))
         self.hw_warning_label.setVisible(False)
-        hw_layout.addWidget(self.hw_warning_label)
+        hw_form.addWidget(self.hw_warning_label, hw_form.rowCount(), 0, 1, 3)
+        self._hw_form = hw_form
 
-        hw_section.addWidget(hw_card)
-        layout.addLayout(hw_section)
+        layout.addWidget(hw_card)
 
-        # ============ Options Section ============
-        options_section = QVBoxLayout()
-        options_section.setSpacing(12)
+        # Shown before this section existed: start the probe now
+        if self.isVisible():
+            self._refresh_hardware_status()
+
+    def _build_options_section(self, layout):
+        layout.addSpacing(8)
 
         options_title = QLabel("选项")
-        options_title.setStyleSheet(f"""
-            font-size: 14px;
-            font-weight: 600;
-            color: {COLORS['text_primary']};
-            font-family: 'Helvetica Neue', 'PingFang SC';
-        """)
-        options_section.addWidget(options_title)
+        options_title.setObjectName("sectionTitle")
+        options_title.setFont(_font('section'))
+        layout.addWidget(options_title)
 
         # Options card
-        options_card = self._create_card()
-        options_layout = QVBoxLayout(options_card)
-        options_layout.setSpacing(0)
-        options_layout.setContentsMargins(0, 0, 0, 0)
+        options_card, options_form = self._create_form_card()
 
         # Toggle rows
         toggles = [
-            ("skip_text_toggle", "跳过已有文字的页面", True),
-            ("auto_open_toggle", "完成后自动打开文件", False),
-            ("sound_toggle", "完成后播放提示音", True),
+            ("skip_text_toggle", "跳过已有文字的页面"),
+            ("auto_open_toggle", "完成后自动打开文件"),
+            ("sound_toggle", "完成后播放提示音"),
         ]
 
-        for i, (name, label, default) in enumerate(toggles):
-            if i > 0:
-                sep = QFrame()
-                sep.setFixedHeight(1)
-                sep.setStyleSheet(f"background-color: {COLORS['border_subtle']};")
-                options_layout.addWidget(sep)
-            
-            toggle_widget = QWidget()
-            toggle_layout = QHBoxLayout(toggle_widget)
-            toggle_layout.setSpacing(12)
-            toggle_layout.setContentsMargins(12, 12, 12, 12)
-            
-            label_widget = QLabel(label)
-            label_widget.setStyleSheet(f"""
-                font-size: 13px;
-                font-weight: 500;
-                color: {COLORS['text_primary']};
-                font-family: 'Helvetica Neue', 'PingFang SC';
-            """)
-            
-            toggle = ToggleSwitch(checked=default)
-            self.toggles[name] = toggle
-            
-            toggle_layout.addWidget(label_widget)
-            toggle_layout.addStretch()
-            toggle_layout.addWidget(toggle)
-            
-            options_layout.addWidget(toggle_widget)
-
-        options_section.addWidget(options_card)
-        layout.addLayout(options_section)
+        self._add_toggle_rows(options_form, toggles)
 
-        layout.addStretch()
+        layout.addWidget(options_card)
 
+    def _build_buttons(self, outer):
         # ── Buttons (always visible at bottom, not scrollable) ────────────
-        btn_separator = QFrame()
-        btn_separator.setFixedHeight(1)
-        btn_separator.setStyleSheet(f"background-color: {COLORS['border_subtle']};")
-        outer.addWidget(btn_separator)
+        outer.addWidget(self._make_sep())
 
         btn_row = QHBoxLayout()
         btn_row.setSpacing(10)
@@ -639,12 +725,12 @@ class SettingsDialog(QDialog):
         cancel_btn = QPushButton("取消")
         cancel_btn.setFixedSize(90, 40)
         cancel_btn.clicked.connect(self.reject)
-        cancel_btn.setStyleSheet(get_button_style('secondary'))
+        cancel_btn.setStyleSheet(_CANCEL_BUTTON_STYLE)
 
         save_btn = QPushButton("保存")
         save_btn.setFixedSize(90, 40)
         save_btn.clicked.connect(self._save_and_close)
-        save_btn.setStyleSheet(get_button_style('primary'))
+        save_btn.setStyleSheet(_SAVE_BUTTON_STYLE)
 
         btn_row.addStretch()
         btn_row.addWidget(cancel_btn)
@@ -652,156 +738,129 @@ class SettingsDialog(QDialog):
 
         outer.addLayout(btn_row)
 
-    def _apply_hardware_status(self, status: str, color: str, warning_text: str):
+    def _apply_hardware_status(self, status: str, accelerated: bool, warning_text: str):
         """Apply hardware status from background detection."""
         self.hw_status_label.setText(status)
-        self.hw_status_label.setStyleSheet(f"""
-            font-size: 13px;
-            color: {color};
-            font-family: 'Helvetica Neue', 'PingFang SC';
-        """)
+        self.hw_status_label.setProperty("accelerated", accelerated)
+        _repolish(self.hw_status_label)
         if warning_text:
             self.hw_warning_label.setText(warning_text)
-            self.hw_warning_label.setVisible(True)
-        else:
-            self.hw_warning_label.setVisible(False)
+        self.hw_warning_label.setVisible(bool(warning_text))
+        # A visible warning row already gets the grid's 12px spacing above
+        # it and carries its own padding, so it replaces the bottom margin
+        self._hw_form.setContentsMargins(0, 12, 0, 0 if warning_text else 12)
 
     def _refresh_hardware_status(self):
         """Populate hardware status label from core.hardware in background."""
+        if self._hardware_status is None and platform.system() == "Darwin":
+            # PaddlePaddle has no GPU backend on macOS, so there is nothing to
+            # probe; skip the thread and the core.hardware import.
+            SettingsDialog._hardware_status = ("Apple CPU (macOS 不支持 GPU 加速)", False, "")
+        if self._hardware_status is not None:
+            self._apply_hardware_status(*self._hardware_status)
+            return
+
         self.hw_status_label.setText("检测中…")
+        SettingsDialog._hardware_listener = self
+        probe = SettingsDialog._hardware_probe
+        if probe is not None and probe.is_alive():
+            return
 
         def _worker():
             status = "CPU 模式"
-            color = COLORS['text_secondary']
+            accelerated = False
             warning_text = ""
             try:
-                import platform
                 from core.hardware import detect_hardware
                 info = detect_hardware()
 
                 if info.recommended_backend == "cuda":
                     status = f"NVIDIA GPU (CUDA {info.cuda_version}, {info.cuda_gpu_count} 卡)"
-                    color = "#2E7D32"
+                    accelerated = True
                 elif info.recommended_backend == "rocm":
                     status = "AMD GPU (ROCm)"
-                    color = "#2E7D32"
-                elif platform.system() == "Darwin":
-                    status = "Apple CPU (macOS 不支持 GPU 加速)"
+                    accelerated = True
 
                 if info.warnings:
                     warning_text = "\n".join(info.warnings)
             except Exception as e:
                 status = f"检测失败: {e}"
-            self.hardware_status_ready.emit(status, color, warning_text)
-
-        threading.Thread(target=_worker, daemon=True).start()
+            else:
+                # Only a successful probe is worth reusing on later opens
+                SettingsDialog._hardware_status = (status, accelerated, warning_text)
+            listener = SettingsDialog._hardware_listener
+            try:
+                if listener is not None:
+                    listener.hardware_status_ready.emit(status, accelerated, warning_text)
+            except RuntimeError:
+                pass  # dialog was closed and deleted while probing
 
+        probe = threading.Thread(target=_worker, daemon=True, name="hardware-probe")
+        SettingsDialog._hardware_probe = probe
+        probe.start()
 
-    def _on_dpi_clicked(self):
-        """Handle DPI button click"""
-        sender = self.sender()
-        dpi = sender.property("dpi")
-        
-        # Uncheck all
-        for btn in self.dpi_buttons.values():
-            btn.setChecked(False)
-        
-        # Check selected
-        self.dpi_buttons[dpi].setChecked(True)
-        self._update_dpi_styles()
-
-    def _update_dpi_styles(self):
-        """Update DPI button styles based on selection"""
-        for dpi, btn in self.dpi_buttons.items():
-            if btn.isChecked():
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: {COLORS['bg_surface']};
-                        color: {COLORS['text_primary']};
-                        border: none;
-                        border-radius: {RADIUS['sm']}px;
-                        padding: 8px;
-                        font-size: 13px;
-                        font-weight: 600;
-                        font-family: 'Helvetica Neue', 'PingFang SC';
-                    }}
-                """)
-            else:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: transparent;
-                        color: {COLORS['text_tertiary']};
-                        border: none;
-                        border-radius: {RADIUS['sm']}px;
-                        padding: 8px;
-                        font-size: 13px;
-                        font-weight: 500;
-                        font-family: 'Helvetica Neue', 'PingFang SC';
-                    }}
-                    QPushButton:hover {{
-                        background-color: {COLORS['bg_muted']};
-                    }}
-                """)
 
     def _browse_dir(self):
         folder = QFileDialog.getExistingDirectory(self, "选择输出目录")
         if folder:
-            self.output_dir_value.setText(folder)
-            self.output_dir_value.setStyleSheet(f"""
-                font-size: 13px;
-                color: {COLORS['text_primary']};
-                font-family: 'Helvetica Neue', 'PingFang SC';
-            """)
+            self._set_output_dir(folder)
+
+    def _set_output_dir(self, path: str):
+        """Show a custom output dir, or the same-as-source placeholder if empty."""
+        self.output_dir_value.setText(path or "与源文件相同")
+        custom = bool(path)
+        if self.output_dir_value.property("custom") != custom:
+            self.output_dir_value.setProperty("custom", custom)
+            _repolish(self.output_dir_value)
 
     def _save_and_close(self):
         self._save_settings()
         self.accept()
 
     def _save_settings(self):
-        settings = QSettings("SmartOCR", "OCRTool")
-
-        # Find selected DPI
-        selected_dpi = "300"
-        for dpi, btn in self.dpi_buttons.items():
-            if btn.isChecked():
-                selected_dpi = dpi
-                break
-
+        self._finish_sections()
         output_dir = self.output_dir_value.text()
-        if output_dir and output_dir != "与源文件相同":
-            settings.setValue("output/use_custom", True)
-            settings.setValue("output/custom_path", output_dir)
-        else:
-            settings.setValue("output/use_custom", False)
-            settings.setValue("output/custom_path", "")
-
-        settings.setValue("output/suffix", self.suffix_edit.text())
-        settings.setValue("quality/dpi", selected_dpi)
-        settings.setValue("options/skip_existing_text", self.toggles["skip_text_toggle"].isChecked())
-        settings.setValue("options/auto_open", self.toggles["auto_open_toggle"].isChecked())
-        settings.setValue("options/play_sound", self.toggles["sound_toggle"].isChecked())
-
-        # Export format settings
-        settings.setValue("export/txt", self.toggles["export_txt_toggle"].isChecked())
-        settings.setValue("export/md", self.toggles["export_md_toggle"].isChecked())
-        settings.setValue("export/md_images", self.toggles["export_md_images_toggle"].isChecked())
-
-        # Performance settings
-        settings.setValue("performance/quality", self.quality_combo.currentData())
-        settings.setValue("performance/num_workers", 1)  # Fixed single-process for stability
-        settings.setValue("performance/gpu_override", self.gpu_combo.currentData())
-
-        # Variant character normalization
-        settings.setValue("ocr/enable_variants", self.toggles["variants_toggle"].isChecked())
-        settings.setValue("output/image_mode", self.image_mode_combo.currentData())
-        settings.setValue("performance/auto_retry_enabled", True)
-        settings.setValue("performance/max_retries", 2)
-        settings.setValue("batch/group_by_language", True)
-        settings.setValue("reliability/page_retry_limit", 2)
-        settings.setValue("reliability/allow_fallback_copy", True)
-        settings.setValue("reliability/show_fallback_detail", True)
-
-        # Clear hardware cache so next OCR run re-evaluates the device
+        use_custom = bool(output_dir) and output_dir != "与源文件相同"
+
+        state = SettingsState(
+            suffix=self.suffix_edit.text(),
+            use_custom_output=use_custom,
+            custom_path=output_dir if use_custom else "",
+            image_mode=self.image_mode_combo.currentData(),
+            dpi=str(self._dpi_group.checkedId()),
+            quality=self.quality_combo.currentData(),
+            gpu_override=self.gpu_combo.currentData(),
+            **{field: self.toggles[name].isChecked() for name, field in _TOGGLE_FIELDS.items()},
+        )
+
+        values = {
+            **state.to_settings(),
+            "performance/num_workers": 1,  # Fixed single-process for stability
+            "performance/auto_retry_enabled": True,
+            "performance/max_retries": 2,
+            "batch/group_by_language": True,
+            "reliability/page_retry_limit": 2,
+            "reliability/allow_fallback_copy": True,
+            "reliability/show_fallback_detail": True,
+        }
+
+        # Write one group at a time and flush to disk once
+        grouped = {}
+        for key, value in values.items():
+            group, name = key.split("/", 1)
+            grouped.setdefault(group, []).append((name, value))
+
+        settings = self._settings
+        for group, entries in grouped.items():
+            settings.beginGroup(group)
+            for name, value in entries:
+                settings.setValue(name, value)
+            settings.endGroup()
+        settings.sync()
+
+        # Clear hardware caches so the next OCR run and the next open of
+        # this dialog re-evaluate the device
+        SettingsDialog._hardware_status = None
         try:
             from core.hardware import clear_cache
             clear_cache()
@@ -809,75 +868,35 @@ class SettingsDialog(QDialog):
             pass
 
     def _load_settings(self):
-        settings = QSettings("SmartOCR", "OCRTool")
-
-        self.suffix_edit.setText(settings.value("output/suffix", "_ocr"))
-
-        # Load output dir
-        if settings.value("output/use_custom", False, type=bool):
-            custom_path = settings.value("output/custom_path", "")
-            if custom_path:
-                self.output_dir_value.setText(custom_path)
-                self.output_dir_value.setStyleSheet(f"""
-                    font-size: 13px;
-                    color: {COLORS['text_primary']};
-                    font-family: 'Helvetica Neue', 'PingFang SC';
-                """)
-        image_mode = settings.value("output/image_mode", "lossy_85")
-        for i in range(self.image_mode_combo.count()):
-            if self.image_mode_combo.itemData(i) == image_mode:
-                self.image_mode_combo.setCurrentIndex(i)
-                break
+        self._finish_sections()
+        state = SettingsState.load(self._settings)
+
+        # Restoring saved values is not an edit; keep change signals quiet
+        blockers = [
+            QSignalBlocker(widget)
+            for widget in (
+                self.suffix_edit, self.image_mode_combo, self.quality_combo,
+                self.gpu_combo, *self.dpi_buttons.values(),
+                *self.toggles.values(),
+            )
+        ]
 
-        # Load DPI
-        dpi = settings.value("quality/dpi", "300")
-        if dpi in self.dpi_buttons:
-            for btn in self.dpi_buttons.values():
-                btn.setChecked(False)
-            self.dpi_buttons[dpi].setChecked(True)
-            self._update_dpi_styles()
-
-        self.toggles["skip_text_toggle"].setChecked(
-            settings.value("options/skip_existing_text", True, type=bool)
-        )
-        self.toggles["auto_open_toggle"].setChecked(
-            settings.value("options/auto_open", False, type=bool)
-        )
-        self.toggles["sound_toggle"].setChecked(
-            settings.value("options/play_sound", True, type=bool)
-        )
+        self.suffix_edit.setText(state.suffix)
 
-        # Load export format settings
-        self.toggles["export_txt_toggle"].setChecked(
-            settings.value("export/txt", False, type=bool)
-        )
-        self.toggles["export_md_toggle"].setChecked(
-            settings.value("export/md", False, type=bool)
-        )
-        self.toggles["export_md_images_toggle"].setChecked(
-            settings.value("export/md_images", False, type=bool)
-        )
+        # Load output dir (always set, so a reused dialog drops unsaved edits)
+        self._set_output_dir(state.custom_path if state.use_custom_output else "")
+        self.image_mode_combo.setCurrentIndex(self._image_mode_index.get(state.image_mode, 0))
 
-        # Load performance settings (map removed "high" to "balanced")
-        quality = settings.value("performance/quality", "fast")
-        if quality == "high":
-            quality = "balanced"
-        for i in range(self.quality_combo.count()):
-            if self.quality_combo.itemData(i) == quality:
-                self.quality_combo.setCurrentIndex(i)
-                break
-
-        # Load variant character toggle
-        self.toggles["variants_toggle"].setChecked(
-            settings.value("ocr/enable_variants", True, type=bool)
-        )
+        # Load DPI
+        if state.dpi in self.dpi_buttons:
+            self.dpi_buttons[state.dpi].setChecked(True)
+
+        for name, field in _TOGGLE_FIELDS.items():
+            self.toggles[name].setChecked(getattr(state, field))
 
-        # Load GPU override
-        gpu_override = settings.value("performance/gpu_override", "auto")
-        for i in range(self.gpu_combo.count()):
-            if self.gpu_combo.itemData(i) == gpu_override:
-                self.gpu_combo.setCurrentIndex(i)
-                break
+        # Load performance settings
+        self.quality_combo.setCurrentIndex(self._quality_index.get(state.quality, 0))
+        self.gpu_combo.setCurrentIndex(self._gpu_index.get(state.gpu_override, 0))
 
-        # Populate hardware status (best-effort, don't block UI if paddle not installed)
-        self._refresh_hardware_status()
+        for blocker in blockers:
+            blocker.unblock()
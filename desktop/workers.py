@@ -6,18 +6,29 @@ Uses optimized pipelined processing for better performance.
 NOTE: OCR imports are done lazily in worker threads to avoid
 loading PaddleOCR at GUI startup (saves ~500MB memory).
 """
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+import gc
+import os
+import random
+import re
 import threading
 import time
+import weakref
 from PySide6.QtCore import QThread, Signal, QObject, QSettings
 
 
+@lru_cache(maxsize=1)
 def _get_variants_path() -> str | None:
     """
     Get the path to variants.txt for variant character support (development mode).
 
     In production, VariantMapper uses embedded data and this returns None.
     In development, returns the path if variants.txt exists on disk.
+    Checked once per process; every engine (re)initialization reuses it.
 
     Returns:
         Path to variants.txt if it exists, None otherwise.
@@ -31,46 +42,188 @@ def _get_variants_path() -> str | None:
 # PaddleOCR at GUI startup
 # from core.ocr_engine import OCREngine
 # from core.pdf_processor import PDFProcessor, ProcessResult
+from core.checkpoint import get_checkpoint_manager
 from core.task_manager import Task, TaskStatus
 
+_settings_handle: QSettings | None = None
 
-def _run_exports(output_pdf_path: str):
+# Workers not yet garbage collected, so shutdown can stop the running ones
+_live_workers: "weakref.WeakSet[QThread]" = weakref.WeakSet()
+
+
+def _settings() -> QSettings:
+    """
+    Shared QSettings for this module.
+
+    A QSettings object must not be shared between threads, so this is only
+    used on the GUI thread: settings are read when a worker is created and
+    handed to it, never from inside run().
+    """
+    global _settings_handle
+    if _settings_handle is None:
+        _settings_handle = QSettings("SmartOCR", "OCRTool")
+    return _settings_handle
+
+# Minimum seconds between page progress signals (~30 per second); pages that
+# need no OCR can otherwise flood the GUI thread's event queue.
+_PROGRESS_INTERVAL = 1 / 30
+
+
+def _throttled(emit_progress):
+    """
+    Wrap a (current, total) progress callback so it fires at most once per
+    _PROGRESS_INTERVAL. The first and last page are always reported.
+    """
+    last_emit = 0.0
+
+    def progress_callback(current: int, total: int):
+        nonlocal last_emit
+        now = time.monotonic()
+        if current <= 1 or current >= total or now - last_emit >= _PROGRESS_INTERVAL:
+            last_emit = now
+            emit_progress(current, total)
+
+    return progress_callback
+
+
+def _summarize_errors(errors: list[str], limit: int = 20) -> str:
+    """
+    Join page warnings for display, folding repeats into a count and keeping
+    only the first `limit` distinct messages, so a damaged document cannot
+    turn one signal payload into megabytes of text.
+    """
+    counts = Counter(errors)
+    shown = [
+        f"{msg} (×{n})" if n > 1 else msg
+        for msg, n in list(counts.items())[:limit]
+    ]
+    if len(counts) > limit:
+        shown.append(f"…（另有 {len(counts) - limit} 条）")
+    return "; ".join(shown)
+
+
+# Engines kept alive per worker. Each holds the Paddle models (~500MB), so only
+# enough to let a batch alternate between two language sets without reloading.
+_ENGINE_CACHE_SIZE = 2
+
+# Upper bound (seconds) on the pause between task retry attempts
+_RETRY_BACKOFF_MAX = 30
+
+
+def _token_pattern(*tokens: str) -> re.Pattern:
+    """Compile lower-case substring tokens into one alternation pattern."""
+    return re.compile("|".join(map(re.escape, tokens)))
+
+
+# Error-message tokens used by OCRWorker._classify_error (matched lower-cased)
+_CANCEL_RE = _token_pattern("取消", "cancelled", "canceled", "interrupt")
+_NON_RETRY_RE = _token_pattern(
+    "permission denied",
+    "权限",
+    "无权限",
+    "file not found",
+    "不存在",
+    "无法打开pdf",
+    "invalid pdf",
+    "损坏",
+    "corrupt",
+    "encrypted",
+    "密码",
+)
+_RETRY_RE = _token_pattern(
+    "timeout",
+    "超时",
+    "brokenprocesspool",
+    "worker",
+    "spawn",
+    "killed",
+    "memory",
+    "内存",
+    "resource temporarily unavailable",
+    "temporarily unavailable",
+    "i/o",
+    "ioerror",
+    "cuda",
+    "rocm",
+    "child process terminated",
+    "process pool is not usable",
+)
+
+
+class TaskError(Exception):
+    """A failed OCR attempt, classified once where it was raised."""
+
+    def __init__(self, kind: str, message: str):
+        super().__init__(message)
+        self.kind = kind  # "cancelled", "retryable" or "non_retryable"
+
+
+@dataclass
+class ExportFlags:
+    """Optional export formats enabled in settings."""
+    txt: bool = False
+    md: bool = False
+    md_images: bool = False
+
+    @classmethod
+    def load(cls) -> "ExportFlags":
+        """Read the export toggles; workers do this once when created."""
+        settings = _settings()
+        return cls(
+            txt=settings.value("export/txt", False, type=bool),
+            md=settings.value("export/md", False, type=bool),
+            md_images=settings.value("export/md_images", False, type=bool),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.txt or self.md or self.md_images
+
+
+@dataclass(frozen=True, slots=True)
+class AttemptProfile:
+    """Processing parameters for one attempt of a task."""
+    dpi: int
+    quality: str
+    num_workers: int
+    use_gpu: bool | None
+    reason: str
+
+
+def _run_exports(output_pdf_path: str, flags: ExportFlags) -> bool:
     """
     Run optional exports (TXT, MD, MD+Images) based on user settings.
 
     Args:
         output_pdf_path: Path to the processed PDF file
-    """
-    settings = QSettings("SmartOCR", "OCRTool")
-    export_txt_enabled = settings.value("export/txt", False, type=bool)
-    export_md_enabled = settings.value("export/md", False, type=bool)
-    export_md_images_enabled = settings.value("export/md_images", False, type=bool)
+        flags: Export formats to write
 
-    if not export_txt_enabled and not export_md_enabled and not export_md_images_enabled:
-        return
+    Returns:
+        False if any enabled export failed (the exporters log and swallow
+        their own errors), else True.
+    """
+    if not flags.enabled:
+        return True
 
     # Lazy import to avoid loading fitz at startup
     from core.pdf_processor import export_txt, export_md, export_md_text_only
 
-    output_path = Path(output_pdf_path)
-    base_path = output_path.with_suffix('')  # Remove .pdf extension
+    base, _ = os.path.splitext(output_pdf_path)  # Remove .pdf extension
 
-    if export_txt_enabled:
-        txt_path = str(base_path) + ".txt"
-        export_txt(output_pdf_path, txt_path)
+    ok = True
+    if flags.txt:
+        ok = export_txt(output_pdf_path, f"{base}.txt") and ok
 
-    if export_md_enabled:
-        md_path = str(base_path) + ".md"
-        export_md_text_only(output_pdf_path, md_path)
+    if flags.md:
+        ok = export_md_text_only(output_pdf_path, f"{base}.md") and ok
 
-    if export_md_images_enabled:
+    if flags.md_images:
         # Use different filename to avoid conflict if both MD options are enabled
-        if export_md_enabled:
-            md_path = str(base_path) + "_images.md"
-        else:
-            md_path = str(base_path) + ".md"
-        images_dir = str(base_path) + "_images"
-        export_md(output_pdf_path, md_path, images_dir)
+        md_path = f"{base}_images.md" if flags.md else f"{base}.md"
+        images_dir = f"{base}_images"
+        ok = export_md(output_pdf_path, md_path, images_dir) and ok
+
+    return ok
 
 
 class OCRWorker(QThread):
@@ -111,9 +264,11 @@ class OCRWorker(QThread):
         image_mode: str = "lossy_85",
         page_retry_limit: int = 2,
         allow_fallback_copy: bool = True,
+        ocr_batch_size: int | None = None,
         parent=None
     ):
         super().__init__(parent)
+        _live_workers.add(self)
         self.tasks = tasks
         self.languages = languages
         self.dpi = dpi
@@ -128,12 +283,24 @@ class OCRWorker(QThread):
         self.image_mode = image_mode
         self.page_retry_limit = max(0, int(page_retry_limit))
         self.allow_fallback_copy = allow_fallback_copy
-        self._stop_requested = False
+        self.ocr_batch_size = ocr_batch_size
+        # Single stop flag, shared with the PDF processor as its cancel_event
         self._cancel_event = threading.Event()
+        self._export_flags = ExportFlags.load()
+        self._enable_variants = _settings().value("ocr/enable_variants", True, type=bool)
+        self._report_lock = threading.Lock()
 
         self._ocr_engine = None
         self._pdf_processor = None
-        self._processor_signature = None
+        self._processor_key = None
+        # engine signature -> OCREngine, least recently used first
+        self._engines: OrderedDict[tuple, object] = OrderedDict()
+        # Retry ladder; attempts past the end reuse the last profile
+        self._attempt_profiles = (
+            AttemptProfile(dpi, quality, num_workers, use_gpu, "原始参数"),
+            AttemptProfile(dpi, quality, 1, use_gpu, "降级为单进程"),
+            AttemptProfile(max(150, dpi - 100), "fast", 1, use_gpu, "单进程 + 快速模式 + 降低DPI"),
+        )
 
     def _init_processor(
         self,
@@ -158,41 +325,49 @@ class OCRWorker(QThread):
         effective_gpu = self.use_gpu if use_gpu is None else use_gpu
         effective_image_mode = image_mode or self.image_mode
 
-        signature = (
-            tuple(langs),
-            effective_quality,
-            effective_dpi,
-            effective_workers,
-            effective_gpu,
-            effective_image_mode,
-        )
-        if self._processor_signature != signature:
+        # Only these shape the engine (and its ~500MB of models); DPI, worker
+        # count and image mode live in the cheap PDFProcessor around it, so a
+        # retry that only changes those reuses the loaded engine.
+        signature = (tuple(langs), effective_quality, effective_gpu, self.ocr_batch_size)
+        engine = self._engines.get(signature)
+        if engine is not None:
+            self._engines.move_to_end(signature)
+        else:
+            from core.ocr_engine import OCREngine
+
+            # Make room first so at most one cached engine coexists with the
+            # one being loaded
             self._ocr_engine = None
             self._pdf_processor = None
+            self._processor_key = None
+            if len(self._engines) >= _ENGINE_CACHE_SIZE:
+                self._engines.popitem(last=False)
+                gc.collect()
 
-        if self._ocr_engine is None:
-            from core.ocr_engine import OCREngine
-            from core.pdf_processor import PDFProcessor
-
-            self._ocr_engine = OCREngine(
+            engine = OCREngine(
                 languages=langs,
                 use_gpu=effective_gpu,
                 quality=effective_quality,
+                batch_size=self.ocr_batch_size,
             )
-            settings = QSettings("SmartOCR", "OCRTool")
-            enable_variants = settings.value("ocr/enable_variants", True, type=bool)
+            self._engines[signature] = engine
+        self._ocr_engine = engine
+
+        processor_key = (signature, effective_dpi, effective_workers, effective_image_mode)
+        if processor_key != self._processor_key:
+            from core.pdf_processor import PDFProcessor
 
             self._pdf_processor = PDFProcessor(
-                self._ocr_engine,
+                engine,
                 dpi=effective_dpi,
                 variants_path=_get_variants_path(),
-                enable_variants=enable_variants,
+                enable_variants=self._enable_variants,
                 num_workers=effective_workers,
                 image_mode=effective_image_mode,
                 page_retry_limit=self.page_retry_limit,
                 allow_fallback_copy=self.allow_fallback_copy,
             )
-            self._processor_signature = signature
+            self._processor_key = processor_key
 
     def notify_models_ready(self):
         """Called by MainWindow after model download completes (or is aborted)."""
@@ -201,112 +376,156 @@ class OCRWorker(QThread):
 
     def run(self):
         """Process all tasks, reinitializing OCR engine if language changes."""
-        # Check whether required models are present; if not, notify the main thread
-        # to show a download dialog and wait until download finishes.
-        from core.ocr_engine import OCREngine
-        missing = OCREngine.get_missing_models(self.quality)
-        if missing:
-            self._model_download_done = threading.Event()
-            self.model_download_needed.emit(missing)
-            self._model_download_done.wait()  # blocks until MainWindow calls notify_models_ready()
-            if self._stop_requested:
-                self.all_complete.emit()
-                return
-
-        # Initialize with the first task's language
-        first_langs = self.tasks[0].languages if self.tasks else self.languages
-        try:
-            self._init_processor(first_langs)
-        except Exception as e:
-            for task in self.tasks:
-                self.task_complete.emit(task.id, False, f"初始化失败: {str(e)}")
+        if not self.tasks:
+            # Nothing to do; don't pay for the OCR imports or model check
             self.all_complete.emit()
             return
 
+        # Settle tasks finished by an earlier, interrupted run of this batch
+        # first, so a fully-finished batch never loads the OCR models. Their
+        # OCR is reused, but exports still run: the export toggles may have
+        # changed since that run.
+        checkpoints = get_checkpoint_manager() if self.enable_checkpoint else None
+        entries = []  # (task, task_langs, settings_key, reused)
         for task in self.tasks:
-            if self._stop_requested:
-                break
+            task_langs = task.languages if task.languages else self.languages
+            settings_key = self._settings_key(task_langs)
+            reused = bool(checkpoints) and checkpoints.is_task_completed(
+                task.input_path, task.output_path, settings_key
+            )
+            entries.append((task, task_langs, settings_key, reused))
 
+        to_ocr = [entry for entry in entries if not entry[3]]
+        init_error = None
+        if to_ocr:
+            # Check whether required models are present; if not, notify the main thread
+            # to show a download dialog and wait until download finishes.
+            from core.ocr_engine import OCREngine
+            missing = OCREngine.get_missing_models(self.quality)
+            if missing:
+                self._model_download_done = threading.Event()
+                self.model_download_needed.emit(missing)
+                self._model_download_done.wait()  # blocks until MainWindow calls notify_models_ready()
+                if self._cancel_event.is_set():
+                    self.all_complete.emit()
+                    return
+
+            # Initialize with the first task that needs OCR
             try:
-                # Reinitialize engine if this task needs different languages
-                task_langs = task.languages if task.languages else self.languages
-                warning = self._process_task_with_retry(task, task_langs)
-                # Pass any non-fatal warnings as the error_message (success=True)
-                self.task_complete.emit(task.id, True, warning or "")
+                self._init_processor(to_ocr[0][1])
             except Exception as e:
-                self.task_complete.emit(task.id, False, str(e))
+                init_error = f"初始化失败: {str(e)}"
 
+        # Exports are disk-bound, so they run while the next file is OCR'd.
+        # A single thread: PyMuPDF documents must not be used concurrently.
+        # Every result, failures included, is reported in task order, as soon
+        # as it and everything before it is known.
+        pending_exports = deque()
+
+        def report(entry):
+            pending_exports.append(entry)
+            self._report_exports(pending_exports, checkpoints)
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="export") as export_pool:
+            for task, task_langs, settings_key, reused in entries:
+                if self._cancel_event.is_set():
+                    break
+
+                if reused:
+                    warning = "已完成（沿用上次输出）"
+                elif init_error:
+                    report((task, init_error, None, None))
+                    continue
+                else:
+                    try:
+                        # Reinitialize engine if this task needs different languages
+                        warning = self._process_task_with_retry(task, task_langs)
+                    except Exception as e:
+                        report((task, str(e), None, None))
+                        continue
+
+                # Reused tasks keep their original record (and its 24h window).
+                # Any warning means a degraded retry, page errors or copied-back
+                # pages, so such output is redone rather than reused.
+                record_key = None if reused or warning else settings_key
+                if self._export_flags.enabled:
+                    future = export_pool.submit(_run_exports, task.output_path, self._export_flags)
+                else:
+                    future = Future()
+                    future.set_result(True)
+                report((task, warning, record_key, future))
+                # Report from the export thread the moment the export is done
+                future.add_done_callback(
+                    lambda _: self._report_exports(pending_exports, checkpoints)
+                )
+
+        self._report_exports(pending_exports, checkpoints)
         self.all_complete.emit()
 
+    def _report_exports(self, pending_exports: deque, checkpoints):
+        """
+        Emit task_complete, in task order, for tasks whose result is known.
+
+        Entries are (task, message, settings_key, future); a None future marks
+        a task that failed before export, with message as its error. Called
+        from both the worker and the export thread, hence the lock.
+        """
+        with self._report_lock:
+            while pending_exports and (
+                pending_exports[0][3] is None or pending_exports[0][3].done()
+            ):
+                self._report_result(checkpoints, *pending_exports.popleft())
+
+    def _report_result(self, checkpoints, task, warning, settings_key, future):
+        """Emit task_complete for one task and record it if it finished."""
+        if future is None:
+            self.task_complete.emit(task.id, False, warning)
+            return
+        try:
+            exported = future.result()
+        except Exception as e:
+            self.task_complete.emit(task.id, False, f"导出失败: {e}")
+            return
+        if exported is False:
+            # Not recorded as finished, so a re-run retries the export
+            self.task_complete.emit(task.id, False, "导出失败: 详见日志")
+            return
+        if checkpoints and settings_key is not None:
+            checkpoints.mark_task_completed(task.input_path, task.output_path, settings_key)
+        # Pass any non-fatal warnings as the error_message (success=True)
+        self.task_complete.emit(task.id, True, warning or "")
+
+    def _settings_key(self, task_langs: list[str]) -> str:
+        """Describe the settings that shape a task's output, for batch resume."""
+        return "|".join([
+            ",".join(task_langs),
+            str(self.dpi),
+            self.quality,
+            self.image_mode,
+            str(self.skip_existing_text),
+            str(self._enable_variants),
+        ])
+
     def _classify_error(self, error_message: str) -> str:
         """Classify errors into retryable / non-retryable / cancelled."""
-        if self._stop_requested or self._cancel_event.is_set():
+        if self._cancel_event.is_set():
             return "cancelled"
 
         msg = (error_message or "").lower()
-        cancelled_tokens = ["取消", "cancelled", "canceled", "interrupt"]
-        if any(token in msg for token in cancelled_tokens):
+        if _CANCEL_RE.search(msg):
             return "cancelled"
-
-        non_retry_tokens = [
-            "permission denied",
-            "权限",
-            "无权限",
-            "file not found",
-            "不存在",
-            "无法打开pdf",
-            "invalid pdf",
-            "损坏",
-            "corrupt",
-            "encrypted",
-            "密码",
-        ]
-        if any(token in msg for token in non_retry_tokens):
+        if _NON_RETRY_RE.search(msg):
             return "non_retryable"
-
-        retryable_tokens = [
-            "timeout",
-            "超时",
-            "brokenprocesspool",
-            "worker",
-            "spawn",
-            "killed",
-            "memory",
-            "内存",
-            "resource temporarily unavailable",
-            "temporarily unavailable",
-            "i/o",
-            "ioerror",
-            "cuda",
-            "rocm",
-            "child process terminated",
-            "process pool is not usable",
-        ]
-        if any(token in msg for token in retryable_tokens):
+        if _RETRY_RE.search(msg):
             return "retryable"
 
         return "non_retryable"
 
-    def _build_attempt_profile(self, attempt_index: int) -> dict:
-        """Build processing parameters for each retry attempt."""
-        profile = {
-            "dpi": self.dpi,
-            "quality": self.quality,
-            "num_workers": self.num_workers,
-            "use_gpu": self.use_gpu,
-            "reason": "原始参数",
-        }
-        if attempt_index == 1:
-            profile["num_workers"] = 1
-            profile["reason"] = "降级为单进程"
-        elif attempt_index >= 2:
-            profile["num_workers"] = 1
-            profile["quality"] = "fast"
-            profile["dpi"] = max(150, self.dpi - 100)
-            profile["reason"] = "单进程 + 快速模式 + 降低DPI"
-        return profile
-
-    def _process_task_once(self, task: Task, task_langs: list[str], profile: dict) -> str:
+    def _build_attempt_profile(self, attempt_index: int) -> AttemptProfile:
+        """Return processing parameters for each retry attempt."""
+        return self._attempt_profiles[min(attempt_index, len(self._attempt_profiles) - 1)]
+
+    def _process_task_once(self, task: Task, task_langs: list[str], profile: AttemptProfile) -> str:
         """Process a single task using pipelined or standard processing.
 
         Returns:
@@ -314,15 +533,16 @@ class OCRWorker(QThread):
         """
         self._init_processor(
             task_langs,
-            quality=profile["quality"],
-            dpi=profile["dpi"],
-            num_workers=profile["num_workers"],
-            use_gpu=profile["use_gpu"],
+            quality=profile.quality,
+            dpi=profile.dpi,
+            num_workers=profile.num_workers,
+            use_gpu=profile.use_gpu,
             image_mode=self.image_mode,
         )
 
+        @_throttled
         def progress_callback(current_page: int, total_pages: int):
-            if not self._stop_requested:
+            if not self._cancel_event.is_set():
                 self.progress.emit(task.id, current_page, total_pages)
 
         if self.use_pipelined:
@@ -346,13 +566,11 @@ class OCRWorker(QThread):
             )
 
         if not result.success:
-            raise Exception(result.error_message or "处理失败")
-
-        # Run optional exports (TXT, MD)
-        _run_exports(task.output_path)
+            message = result.error_message or "处理失败"
+            raise TaskError(self._classify_error(message), message)
 
         # Return any non-fatal warnings (e.g., recovered missing pages)
-        return "; ".join(result.errors) if result.errors else ""
+        return _summarize_errors(result.errors)
 
     def _process_task_with_retry(self, task: Task, task_langs: list[str]) -> str:
         """Run one task with bounded retry and progressive fallback."""
@@ -366,32 +584,39 @@ class OCRWorker(QThread):
                 if attempt_index > 0:
                     self.task_status.emit(
                         task.id,
-                        f"重试中 ({attempt_index}/{max_attempts - 1}) · {profile['reason']}"
+                        f"重试中 ({attempt_index}/{max_attempts - 1}) · {profile.reason}"
                     )
                 warning = self._process_task_once(task, task_langs, profile)
                 if attempt_index > 0:
                     recovered_notes.append(
-                        f"已自动重试成功（第{attempt_index + 1}次，{profile['reason']}）"
+                        f"已自动重试成功（第{attempt_index + 1}次，{profile.reason}）"
                     )
                 if warning:
                     recovered_notes.append(warning)
                 return "；".join(recovered_notes)
             except Exception as exc:
                 error_message = str(exc)
-                error_kind = self._classify_error(error_message)
+                if isinstance(exc, TaskError):
+                    error_kind = exc.kind
+                else:
+                    error_kind = self._classify_error(error_message)
                 attempt_errors.append(f"尝试{attempt_index + 1}: {error_message}")
                 if error_kind == "cancelled":
                     raise Exception("处理已取消")
                 if error_kind != "retryable" or attempt_index >= max_attempts - 1:
                     break
-                time.sleep(1.5 * (2 ** (attempt_index)))
+                # Jittered, capped backoff; request_stop() cuts the wait short
+                delay = min(_RETRY_BACKOFF_MAX, 1.5 * (2 ** attempt_index))
+                if self._cancel_event.wait(delay * random.uniform(0.8, 1.2)):
+                    raise Exception("处理已取消")
 
         raise Exception("；".join(attempt_errors))
 
     def request_stop(self):
         """Request worker to stop after current task"""
-        self._stop_requested = True
         self._cancel_event.set()
+        # Don't leave run() blocked waiting for a model download
+        self.notify_models_ready()
 
 
 class SingleFileWorker(QThread):
@@ -424,9 +649,11 @@ class SingleFileWorker(QThread):
         image_mode: str = "lossy_85",
         page_retry_limit: int = 2,
         allow_fallback_copy: bool = True,
+        ocr_batch_size: int | None = None,
         parent=None
     ):
         super().__init__(parent)
+        _live_workers.add(self)
         self.input_path = input_path
         self.output_path = output_path
         self.languages = languages
@@ -439,8 +666,11 @@ class SingleFileWorker(QThread):
         self.image_mode = image_mode
         self.page_retry_limit = max(0, int(page_retry_limit))
         self.allow_fallback_copy = allow_fallback_copy
-        self._stop_requested = False
+        self.ocr_batch_size = ocr_batch_size
+        # Single stop flag, shared with the PDF processor as its cancel_event
         self._cancel_event = threading.Event()
+        self._export_flags = ExportFlags.load()
+        self._enable_variants = _settings().value("ocr/enable_variants", True, type=bool)
 
     def run(self):
         """Process the file using pipelined processing with checkpoint support"""
@@ -453,23 +683,23 @@ class SingleFileWorker(QThread):
                 languages=self.languages,
                 use_gpu=self.use_gpu,
                 quality=self.quality,
+                batch_size=self.ocr_batch_size,
             )
-            settings = QSettings("SmartOCR", "OCRTool")
-            enable_variants = settings.value("ocr/enable_variants", True, type=bool)
 
             processor = PDFProcessor(
                 engine,
                 dpi=self.dpi,
                 variants_path=_get_variants_path(),
-                enable_variants=enable_variants,
+                enable_variants=self._enable_variants,
                 num_workers=self.num_workers,
                 image_mode=self.image_mode,
                 page_retry_limit=self.page_retry_limit,
                 allow_fallback_copy=self.allow_fallback_copy,
             )
 
+            @_throttled
             def progress_callback(current: int, total: int):
-                if not self._stop_requested:
+                if not self._cancel_event.is_set():
                     self.progress.emit(current, total)
 
             if self.use_pipelined:
@@ -489,7 +719,7 @@ class SingleFileWorker(QThread):
 
             if result.success:
                 # Run optional exports (TXT, MD)
-                _run_exports(self.output_path)
+                _run_exports(self.output_path, self._export_flags)
                 self.complete.emit(True, self.output_path, "")
             else:
                 self.complete.emit(False, "", result.error_message)
@@ -499,7 +729,6 @@ class SingleFileWorker(QThread):
 
     def request_stop(self):
         """Request worker to stop"""
-        self._stop_requested = True
         self._cancel_event.set()
 
 
@@ -508,10 +737,11 @@ def get_performance_settings() -> dict:
     Get performance settings from QSettings.
 
     Returns:
-        Dict with 'quality', 'num_workers', 'use_gpu', retry and image options.
+        Dict with 'quality', 'num_workers', 'use_gpu', 'ocr_batch_size', retry
+        and image options.
         use_gpu=None means auto-detect hardware.
     """
-    settings = QSettings("SmartOCR", "OCRTool")
+    settings = _settings()
     quality = settings.value("performance/quality", "fast")
     # Migrate removed "high" quality to "balanced" for existing users
     if quality == "high":
@@ -536,4 +766,22 @@ def get_performance_settings() -> dict:
         'image_mode': settings.value("output/image_mode", "lossy_85"),
         'page_retry_limit': settings.value("reliability/page_retry_limit", 2, type=int),
         'allow_fallback_copy': settings.value("reliability/allow_fallback_copy", True, type=bool),
+        # Advanced key with no control in SettingsDialog (documented in README);
+        # None when unset, so PaddleOCR keeps its own default batch size
+        'ocr_batch_size': settings.value("performance/ocr_batch_size", 0, type=int) or None,
     }
+
+
+def stop_all_workers(timeout_ms: int = 5000):
+    """
+    Ask every running worker to stop and wait for it to save its progress.
+
+    Used on application shutdown (e.g. SIGTERM), where there is no window to
+    confirm with; page checkpoints let the next run resume.
+    """
+    running = [worker for worker in _live_workers if worker.isRunning()]
+    for worker in running:
+        worker.request_stop()
+    deadline = time.monotonic() + timeout_ms / 1000
+    for worker in running:
+        worker.wait(max(0, int((deadline - time.monotonic()) * 1000)))
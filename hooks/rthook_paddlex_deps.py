@@ -8,16 +8,24 @@ import sys
 
 # Only apply in frozen/packaged environment
 if getattr(sys, 'frozen', False):
+    # Each patch is tagged with _smartocr_patched and only installed once, so
+    # running this hook again never wraps a patch in another patch.
+
     # Fix paddle/base/core.py crash: site.getsitepackages() can return
     # [None, ...] in PyInstaller, causing os.path.sep.join() to fail with
     # "sequence item 0: expected str instance, NoneType found".
     import site as _site
-    if hasattr(_site, 'getsitepackages'):
+    if hasattr(_site, 'getsitepackages') and not getattr(
+        _site.getsitepackages, '_smartocr_patched', False
+    ):
         _orig_getsitepackages = _site.getsitepackages
         def _patched_getsitepackages():
             return [p for p in _orig_getsitepackages() if p is not None]
+        _patched_getsitepackages._smartocr_patched = True
         _site.getsitepackages = _patched_getsitepackages
 
+    import functools
+    import importlib.machinery
     import importlib.metadata
     import importlib.util
 
@@ -63,18 +71,29 @@ if getattr(sys, 'frozen', False):
         'yaml': '6.0.0',
     }
 
+    def _normalize(name):
+        return name.lower().replace('-', '_').replace('.', '_')
+
+    # Normalized once at hook load so each lookup is a single dict hit
+    _BUNDLED_NORMALIZED = {
+        _normalize(name): version for name, version in _BUNDLED_PACKAGES.items()
+    }
+
+    @functools.lru_cache(maxsize=None)
+    def _fake_spec(name):
+        # One shared spec per name: PaddleX probes the same packages repeatedly.
+        # A real ModuleSpec passes isinstance checks in other import hooks.
+        return importlib.machinery.ModuleSpec(name, None)
+
     # Store original functions
     _original_version = importlib.metadata.version
     _original_find_spec = importlib.util.find_spec
 
     def _patched_version(package_name):
         """Return fake version for bundled packages."""
-        # Normalize package name
-        normalized = package_name.lower().replace('-', '_').replace('.', '_')
-        for bundled_name, version in _BUNDLED_PACKAGES.items():
-            bundled_normalized = bundled_name.lower().replace('-', '_').replace('.', '_')
-            if normalized == bundled_normalized:
-                return version
+        version = _BUNDLED_NORMALIZED.get(_normalize(package_name))
+        if version is not None:
+            return version
         return _original_version(package_name)
 
     def _patched_find_spec(name, package=None):
@@ -84,20 +103,15 @@ if getattr(sys, 'frozen', False):
             return result
 
         # Check if it's a bundled package
-        normalized = name.lower().replace('-', '_').replace('.', '_')
-        for bundled_name in _BUNDLED_PACKAGES:
-            bundled_normalized = bundled_name.lower().replace('-', '_').replace('.', '_')
-            if normalized == bundled_normalized:
-                # Return a fake ModuleSpec
-                class FakeSpec:
-                    def __init__(self, name):
-                        self.name = name
-                        self.loader = None
-                        self.origin = None
-                        self.submodule_search_locations = None
-                return FakeSpec(name)
+        if _normalize(name) in _BUNDLED_NORMALIZED:
+            return _fake_spec(name)
         return result
 
+    _patched_version._smartocr_patched = True
+    _patched_find_spec._smartocr_patched = True
+
     # Apply patches
-    importlib.metadata.version = _patched_version
-    importlib.util.find_spec = _patched_find_spec
+    if not getattr(importlib.metadata.version, '_smartocr_patched', False):
+        importlib.metadata.version = _patched_version
+    if not getattr(importlib.util.find_spec, '_smartocr_patched', False):
+        importlib.util.find_spec = _patched_find_spec
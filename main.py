@@ -5,6 +5,7 @@
 Usage:
     python main.py              # Launch GUI
     python main.py input.pdf    # Process single file
+    python main.py input.pdf --hpi  # Same, with high-performance inference
 """
 import os
 import sys
@@ -76,6 +77,17 @@ def _cleanup_stale_files():
 
 def main():
     """Main entry point"""
+    # Help needs nothing else; answer it before touching any core module
+    if len(sys.argv) > 1 and sys.argv[1] in ('-h', '--help'):
+        print(__doc__)
+        print("Options:")
+        print("  -h, --help       Show this help message")
+        print("  --smoke-test     Verify packaged app can import all modules")
+        print("  <file.pdf>       Process a single PDF file")
+        print("  --hpi            With <file.pdf>: use PaddleOCR high-performance")
+        print("                   inference (requires the HPI plugin)")
+        return 0
+
     _setup_exception_handler()
     # Clean up stale files from previous crashes
     _cleanup_stale_files()
@@ -84,18 +96,10 @@ def main():
     if len(sys.argv) > 1:
         # CLI mode - process file directly
         input_path = sys.argv[1]
-        if input_path in ('-h', '--help'):
-            print(__doc__)
-            print("Options:")
-            print("  -h, --help       Show this help message")
-            print("  --smoke-test     Verify packaged app can import all modules")
-            print("  <file.pdf>       Process a single PDF file")
-            return 0
-
         if input_path == '--smoke-test':
             return smoke_test()
 
-        return cli_process(input_path)
+        return cli_process(input_path, hpi='--hpi' in sys.argv[2:])
 
     # GUI mode
     return gui_main()
@@ -162,9 +166,11 @@ def smoke_test():
 
 def gui_main():
     """Launch the GUI application"""
+    import signal
     from PySide6.QtWidgets import QApplication
-    from PySide6.QtCore import Qt
+    from PySide6.QtCore import QCoreApplication, Qt, QTimer
     from desktop.main_window import MainWindow
+    from desktop.workers import stop_all_workers
 
     # Enable High DPI support
     QApplication.setHighDpiScaleFactorRoundingPolicy(
@@ -181,14 +187,29 @@ def gui_main():
     window = MainWindow()
     window.show()
 
+    # SIGTERM (logout, container stop): stop running workers so they keep
+    # their checkpoints, then leave the event loop directly. app.quit() would
+    # send closeEvent to the window, whose confirm dialog nobody can answer.
+    def _on_sigterm(*_):
+        stop_all_workers()
+        QCoreApplication.exit(0)
+
+    signal.signal(signal.SIGTERM, _on_sigterm)
+    # Python handlers only run between bytecodes; let the interpreter wake up
+    signal_wakeup = QTimer()
+    signal_wakeup.timeout.connect(lambda: None)
+    signal_wakeup.start(500)
+    app.aboutToQuit.connect(stop_all_workers)
+
     return app.exec()
 
 
-def cli_process(input_path: str):
+def cli_process(input_path: str, hpi: bool = False):
     """
     Process a single PDF file from command line.
 
-    Uses pipelined processing for improved performance.
+    Uses pipelined processing for improved performance. With hpi=True the
+    engine runs through PaddleOCR's high-performance inference backends.
     """
     from core.ocr_engine import OCREngine
     from core.pdf_processor import PDFProcessor
@@ -211,7 +232,7 @@ def cli_process(input_path: str):
     try:
         # Initialize OCR engine
         print("Initializing OCR engine...")
-        engine = OCREngine(languages=['ch', 'en'])
+        engine = OCREngine(languages=['ch', 'en'], enable_hpi=hpi)
         processor = PDFProcessor(engine, dpi=150)  # Use lower DPI for faster processing
 
         # Progress callback
@@ -328,6 +328,79 @@ class TestCheckpointManager:
         assert cleaned >= 1
         assert not checkpoint_path.exists()
 
+    def test_batch_task_completed(self, manager, temp_pdf):
+        """Test skipping files finished by an earlier batch run"""
+        output_path = temp_pdf.replace(".pdf", "_ocr.pdf")
+        Path(output_path).touch()
+
+        try:
+            assert not manager.is_task_completed(temp_pdf, output_path, "ch|300")
+            manager.mark_task_completed(temp_pdf, output_path, "ch|300")
+
+            # Record survives a new manager (i.e. an app restart)
+            restarted = CheckpointManager(checkpoint_dir=str(manager.checkpoint_dir))
+            assert restarted.is_task_completed(temp_pdf, output_path, "ch|300")
+            # Different settings or a changed output mean redo
+            assert not restarted.is_task_completed(temp_pdf, output_path, "en|300")
+            os.utime(output_path, (time.time() + 10, time.time() + 10))
+            assert not restarted.is_task_completed(temp_pdf, output_path, "ch|300")
+        finally:
+            os.unlink(output_path)
+
+    def test_batch_task_record_edge_cases(self, manager, temp_pdf):
+        """Test malformed records, missing outputs and forgotten tasks"""
+        import json
+
+        output_path = temp_pdf.replace(".pdf", "_ocr.pdf")
+        Path(output_path).touch()
+
+        try:
+            # Truncated / older-format entries are ignored, not fatal
+            state_path = Path(manager.checkpoint_dir) / "batch_state.json"
+            state_path.write_text(json.dumps({"schema": 1, "tasks": {
+                temp_pdf: {"completed_at": time.time()},
+            }}), encoding="utf-8")
+            restarted = CheckpointManager(checkpoint_dir=str(manager.checkpoint_dir))
+            assert not restarted.is_task_completed(temp_pdf, output_path, "ch|300")
+
+            restarted.mark_task_completed(temp_pdf, output_path, "ch|300")
+            assert restarted.is_task_completed(temp_pdf, output_path, "ch|300")
+            restarted.forget_task(temp_pdf)
+            assert not restarted.is_task_completed(temp_pdf, output_path, "ch|300")
+
+            restarted.mark_task_completed(temp_pdf, output_path, "ch|300")
+            os.unlink(output_path)
+            assert not restarted.is_task_completed(temp_pdf, output_path, "ch|300")
+        finally:
+            if os.path.exists(output_path):
+                os.unlink(output_path)
+
+    def test_batch_records_from_several_threads(self, manager, temp_pdf):
+        """Test concurrent marking and forgetting keeps batch_state.json valid"""
+        import json
+        import threading
+
+        output_path = temp_pdf.replace(".pdf", "_ocr.pdf")
+        Path(output_path).touch()
+
+        def mark(start):
+            for i in range(start, start + 50):
+                manager.mark_task_completed(temp_pdf, output_path, f"key{i}")
+                manager.forget_task(f"{temp_pdf}.{i}")
+
+        try:
+            threads = [threading.Thread(target=mark, args=(i * 50,)) for i in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            state_path = Path(manager.checkpoint_dir) / "batch_state.json"
+            tasks = json.loads(state_path.read_text(encoding="utf-8"))["tasks"]
+            assert list(tasks) == [temp_pdf]
+        finally:
+            os.unlink(output_path)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,283 @@
+"""
+Tests for desktop worker helpers and batch resume
+"""
+import sys
+import tempfile
+import time
+import types
+from pathlib import Path
+import pytest
+
+# Skip all tests if the GUI toolkit is not available
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import QSettings, Qt
+from core.checkpoint import CheckpointManager
+from core.task_manager import Task
+from desktop import workers
+from desktop.workers import OCRWorker
+
+
+class TestBatchResume:
+    """Tests for skipping tasks finished by an earlier batch run"""
+
+    @pytest.fixture
+    def manager(self, monkeypatch):
+        """Point the workers at a CheckpointManager in a temp directory"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = CheckpointManager(checkpoint_dir=tmpdir)
+            monkeypatch.setattr(workers, "get_checkpoint_manager", lambda: manager)
+            # Keep the user's own settings out of the settings key and exports
+            settings = QSettings(str(Path(tmpdir) / "settings.ini"), QSettings.Format.IniFormat)
+            monkeypatch.setattr(workers, "_settings", lambda: settings)
+            monkeypatch.setattr(workers.ExportFlags, "load", classmethod(lambda cls: cls()))
+            # The model check only needs get_missing_models
+            fake_engine = types.ModuleType("core.ocr_engine")
+            fake_engine.OCREngine = type(
+                "OCREngine", (), {"get_missing_models": staticmethod(lambda quality: [])}
+            )
+            monkeypatch.setitem(sys.modules, "core.ocr_engine", fake_engine)
+            yield manager
+
+    @pytest.fixture
+    def task(self):
+        """A task whose input and output files exist"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = Path(tmpdir) / "scan.pdf"
+            output_path = Path(tmpdir) / "scan_ocr.pdf"
+            input_path.write_bytes(b"%PDF-1.4")
+            output_path.write_bytes(b"%PDF-1.4")
+            yield Task(id=1, input_path=str(input_path), output_path=str(output_path),
+                       languages=["ch"])
+
+    def _run(self, worker):
+        """Run the worker inline, recording OCR calls and reported results"""
+        ocr_calls = []
+        results = []
+        worker._init_processor = lambda *args, **kwargs: None
+        worker._process_task_with_retry = lambda task, langs: ocr_calls.append(task.id) or ""
+        worker.task_complete.connect(lambda *args: results.append(args))
+        worker.run()
+        return ocr_calls, results
+
+    def test_matching_settings_skip_ocr(self, manager, task):
+        """Test a finished task is reused when the settings match"""
+        worker = OCRWorker(tasks=[task], languages=["ch"], dpi=300)
+        manager.mark_task_completed(task.input_path, task.output_path,
+                                    worker._settings_key(["ch"]))
+
+        ocr_calls, results = self._run(worker)
+
+        assert ocr_calls == []
+        assert results == [(1, True, "已完成（沿用上次输出）")]
+
+    def test_changed_settings_rerun(self, manager, task):
+        """Test a finished task is processed again when the settings changed"""
+        earlier = OCRWorker(tasks=[task], languages=["ch"], dpi=300)
+        manager.mark_task_completed(task.input_path, task.output_path,
+                                    earlier._settings_key(["ch"]))
+
+        ocr_calls, results = self._run(OCRWorker(tasks=[task], languages=["ch"], dpi=150))
+
+        assert ocr_calls == [1]
+        assert results == [(1, True, "")]
+
+    def test_warning_not_recorded(self, manager, task):
+        """Test a task finished with warnings is not reused by the next run"""
+        worker = OCRWorker(tasks=[task], languages=["ch"])
+        worker._init_processor = lambda *args, **kwargs: None
+        worker._process_task_with_retry = lambda task, langs: "已自动重试成功（第2次，降级为单进程）"
+        worker.run()
+
+        assert not manager.is_task_completed(task.input_path, task.output_path,
+                                             worker._settings_key(["ch"]))
+
+    def test_forgotten_task_rerun(self, manager, task):
+        """Test reprocessing a task drops its record"""
+        worker = OCRWorker(tasks=[task], languages=["ch"], dpi=300)
+        manager.mark_task_completed(task.input_path, task.output_path,
+                                    worker._settings_key(["ch"]))
+        manager.forget_task(task.input_path)
+
+        ocr_calls, _ = self._run(worker)
+
+        assert ocr_calls == [1]
+
+    def test_results_in_task_order(self, manager, task, monkeypatch):
+        """Test a failed export is not recorded and results keep task order"""
+        def slow_failed_export(output_pdf_path, flags):
+            time.sleep(0.1)
+            return False
+
+        monkeypatch.setattr(workers, "_run_exports", slow_failed_export)
+        second = Task(id=2, input_path=task.input_path, output_path=task.output_path,
+                      languages=["ch"])
+        worker = OCRWorker(tasks=[task, second], languages=["ch"])
+        worker._export_flags = workers.ExportFlags(txt=True)
+
+        def process(task, langs):
+            if task.id == 2:
+                raise Exception("invalid pdf")
+            return ""
+
+        results = []
+        worker._init_processor = lambda *args, **kwargs: None
+        worker._process_task_with_retry = process
+        # Export results are reported from the export thread
+        worker.task_complete.connect(lambda *args: results.append(args),
+                                     Qt.ConnectionType.DirectConnection)
+        worker.run()
+
+        assert [(task_id, success) for task_id, success, _ in results] == [(1, False), (2, False)]
+        assert results[0][2].startswith("导出失败")
+        assert not manager.is_task_completed(task.input_path, task.output_path,
+                                             worker._settings_key(["ch"]))
+
+    def test_reported_before_next_task(self, manager, task):
+        """Test a task is reported before the next one starts when exports are off"""
+        second = Task(id=2, input_path=task.input_path, output_path=task.output_path,
+                      languages=["ch"])
+        worker = OCRWorker(tasks=[task, second], languages=["ch"])
+        worker._export_flags = workers.ExportFlags()
+
+        events = []
+        worker._init_processor = lambda *args, **kwargs: None
+        worker._process_task_with_retry = lambda task, langs: events.append(("ocr", task.id)) or ""
+        worker.task_complete.connect(lambda task_id, *args: events.append(("done", task_id)))
+        worker.run()
+
+        assert events == [("ocr", 1), ("done", 1), ("ocr", 2), ("done", 2)]
+
+
+class TestSummarizeErrors:
+    """Tests for folding page warnings into one message"""
+
+    def test_repeats_are_counted(self):
+        """Test repeated messages collapse into one entry with a count"""
+        errors = ["页 1 失败", "页 2 失败", "页 1 失败", "页 1 失败"]
+        assert workers._summarize_errors(errors) == "页 1 失败 (×3); 页 2 失败"
+
+    def test_distinct_messages_are_truncated(self):
+        """Test only the first `limit` distinct messages are kept"""
+        errors = [f"页 {i} 失败" for i in range(5)] * 2
+        summary = workers._summarize_errors(errors, limit=3)
+        assert summary == "页 0 失败 (×2); 页 1 失败 (×2); 页 2 失败 (×2); …（另有 2 条）"
+
+    def test_no_errors(self):
+        """Test an empty list gives an empty string"""
+        assert workers._summarize_errors([]) == ""
+
+
+class TestThrottledProgress:
+    """Tests for rate-limiting per-page progress callbacks"""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Replace the workers' monotonic clock with a settable one"""
+        now = [100.0]
+        monkeypatch.setattr(workers, "time", types.SimpleNamespace(monotonic=lambda: now[0]))
+        return now
+
+    def test_emit_interval(self, clock):
+        """Test pages inside one interval are dropped, later ones pass"""
+        emitted = []
+        progress = workers._throttled(lambda current, total: emitted.append(current))
+
+        progress(1, 10)  # first page always reported
+        clock[0] += workers._PROGRESS_INTERVAL / 3
+        progress(2, 10)
+        progress(3, 10)
+        clock[0] += workers._PROGRESS_INTERVAL
+        progress(4, 10)
+        progress(5, 10)
+
+        assert emitted == [1, 4]
+
+    def test_final_page_flushed(self, clock):
+        """Test the last page is reported even inside the interval"""
+        emitted = []
+        progress = workers._throttled(lambda current, total: emitted.append(current))
+
+        for page in range(1, 11):
+            progress(page, 10)
+
+        assert emitted == [1, 10]
+
+
+class TestErrorClassification:
+    """Tests for sorting task failures into retry categories"""
+
+    @pytest.fixture
+    def worker(self, monkeypatch, tmp_path):
+        """A worker that does not read the user's settings"""
+        settings = QSettings(str(tmp_path / "settings.ini"), QSettings.Format.IniFormat)
+        monkeypatch.setattr(workers, "_settings", lambda: settings)
+        monkeypatch.setattr(workers.ExportFlags, "load", classmethod(lambda cls: cls()))
+        return OCRWorker(tasks=[], languages=["ch"])
+
+    @pytest.mark.parametrize("message, kind", [
+        ("处理已取消", "cancelled"),
+        ("Task cancelled by user", "cancelled"),
+        ("Operation Canceled", "cancelled"),
+        ("KeyboardInterrupt", "cancelled"),
+        ("[Errno 13] Permission denied: 'out.pdf'", "non_retryable"),
+        ("没有写入权限", "non_retryable"),
+        ("File not found: a.pdf", "non_retryable"),
+        ("文件不存在", "non_retryable"),
+        ("无法打开PDF文件: broken", "non_retryable"),
+        ("Invalid PDF header", "non_retryable"),
+        ("文件已损坏", "non_retryable"),
+        ("xref table is corrupt", "non_retryable"),
+        ("document is encrypted", "non_retryable"),
+        ("需要密码", "non_retryable"),
+        ("Timeout waiting for page", "retryable"),
+        ("OCR 超时", "retryable"),
+        ("BrokenProcessPool: a child died", "retryable"),
+        ("worker exited unexpectedly", "retryable"),
+        ("failed to spawn process", "retryable"),
+        ("process was killed", "retryable"),
+        ("Out of memory", "retryable"),
+        ("内存不足", "retryable"),
+        ("Resource temporarily unavailable", "retryable"),
+        ("I/O operation on closed file", "retryable"),
+        ("IOError: disk busy", "retryable"),
+        ("CUDA error: device-side assert", "retryable"),
+        ("ROCm runtime error", "retryable"),
+        ("A child process terminated abruptly", "retryable"),
+        ("the process pool is not usable anymore", "retryable"),
+        # Earlier categories win when tokens from several appear
+        ("cancelled after timeout", "cancelled"),
+        ("permission denied while waiting for worker", "non_retryable"),
+        # Unknown failures are not retried
+        ("something unexpected", "non_retryable"),
+        ("", "non_retryable"),
+    ])
+    def test_classify_message(self, worker, message, kind):
+        """Test each message maps to the same category as the token lists did"""
+        assert worker._classify_error(message) == kind
+
+    def test_stop_request_cancels(self, worker):
+        """Test any failure after a stop request counts as cancelled"""
+        worker.request_stop()
+        assert worker._classify_error("timeout") == "cancelled"
+
+    def test_task_error_kind_is_trusted(self, worker):
+        """Test the retry loop uses TaskError.kind instead of re-classifying"""
+        attempts = []
+
+        def fail(task, langs, profile):
+            attempts.append(profile)
+            # Message says "timeout", but the raiser classified it as final
+            raise workers.TaskError("non_retryable", "timeout")
+
+        worker._process_task_once = fail
+        worker._classify_error = lambda message: pytest.fail("re-classified")
+        task = Task(id=1, input_path="in.pdf", output_path="out.pdf")
+
+        with pytest.raises(Exception, match="timeout"):
+            worker._process_task_with_retry(task, ["ch"])
+        assert len(attempts) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])